@@ -0,0 +1,3 @@
+# coding=UTF-8
+
+"""Provides benchmarks for performance-sensitive parts of the plugin."""
@@ -0,0 +1,340 @@
+# coding=UTF-8
+
+"""Benchmark cold starts of the plugin.
+
+Measures wall time and memory of importing the plugin's modules and of the
+first call of each lifecycle operation against the fake control plane, every
+measurement in a fresh interpreter, and attributes import time to the modules
+being imported. Fails when a measurement exceeds its threshold.
+
+Run from the repository root with `python -m benchmarks.coldstart`, with the
+plugin's dependencies installed, e.g. through the `coldstart` tox environment;
+a module that cannot be imported fails the benchmarks. Memory is measured as
+the growth of the peak resident set size.
+"""
+
+from __future__ import print_function
+
+import os
+import resource
+import sys
+from timeit import default_timer
+
+IMPORTS = ('resttypes.enums', 'resttypes.cobjects', 'resttypes.endpoints',
+           'fcoclient.api', 'cfy.sshkey', 'cfy.server')
+
+# Thresholds as (wall time in ms, memory in MB)
+IMPORT_THRESHOLDS = {
+    'resttypes.enums': (100, 15),
+    'resttypes.cobjects': (150, 20),
+    'resttypes.endpoints': (200, 25),
+    'fcoclient.api': (400, 30),
+    'cfy.sshkey': (1500, 60),
+    'cfy.server': (2500, 80),
+}
+OPERATION_THRESHOLDS = {
+    # Includes generating a 2048 bit RSA key
+    'sshkey.create': (5000, 40),
+    'sshkey.creation_validation': (500, 10),
+    'server.create': (2000, 30),
+    'server.stop': (500, 10),
+    'server.start': (500, 10),
+    'server.creation_validation': (500, 10),
+    'server.delete': (500, 10),
+    'sshkey.delete': (500, 10),
+}
+
+REPEAT = 5
+ATTRIBUTION_COUNT = 20
+
+RESULT_PREFIX = 'RESULT '
+
+
+def max_rss():
+    """Peak resident set size of the process in MB."""
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on OS X and in kilobytes elsewhere
+    return rss / 1024.0 ** (2 if sys.platform == 'darwin' else 1)
+
+
+class Measurement(object):
+
+    """Context manager measuring wall time and memory of its block."""
+
+    def __enter__(self):
+        self.rss = max_rss()
+        self.start = default_timer()
+        return self
+
+    def __exit__(self, *args):
+        self.time = (default_timer() - self.start) * 1000
+        self.memory = max_rss() - self.rss
+
+
+class ImportProfiler(object):
+
+    """Attribute import time and memory to the modules being imported.
+
+    Records the time spent importing each module excluding (self) and
+    including (cumulative) the modules it imports in turn. Profiling slows
+    imports down, so only relative times are meaningful.
+    """
+
+    def __init__(self):
+        self.records = {}
+        self._stack = []
+        self._import = None
+
+    def __enter__(self):
+        import __builtin__
+        self._import = __builtin__.__import__
+        __builtin__.__import__ = self.import_
+        return self
+
+    def __exit__(self, *args):
+        import __builtin__
+        __builtin__.__import__ = self._import
+
+    def import_(self, name, *args, **kwargs):
+        before = set(sys.modules)
+        self._stack.append(0.0)
+        with Measurement() as m:
+            try:
+                module = self._import(name, *args, **kwargs)
+            finally:
+                nested = self._stack.pop()
+        self._record(name, before, m, nested)
+        return module
+
+    def _record(self, name, before, m, nested):
+        """Record the modules loaded by an import."""
+        if self._stack:
+            self._stack[-1] += m.time
+        # Python 2 marks failed implicit relative imports with None
+        new = [n for n in set(sys.modules) - before
+               if sys.modules[n] is not None and n not in self.records]
+        if new:
+            named = [n for n in new if n == name or n.endswith('.' + name)]
+            module = min(named or new, key=len)
+            self.records[module] = (m.time - nested, m.time, m.memory)
+
+    def top(self, count=ATTRIBUTION_COUNT):
+        """
+        Get the modules taking the longest to import themselves.
+
+        :param count: number of modules
+        :return: list of (module, self time, cumulative time, memory) tuples
+        """
+        records = sorted(self.records.items(), key=lambda r: -r[1][0])
+        return [(module,) + record for module, record in records[:count]]
+
+
+###############################################################################
+# Measurements, each run in a fresh interpreter
+###############################################################################
+
+def measure_import(module):
+    """Measure importing a module."""
+    from importlib import import_module
+    with Measurement() as m:
+        import_module(module)
+    return {module: (m.time, m.memory)}
+
+
+def profile_imports(*modules):
+    """Attribute the time of importing modules to the modules imported."""
+    from importlib import import_module
+    failed = []
+    with ImportProfiler() as profiler:
+        for module in modules:
+            try:
+                import_module(module)
+            except ImportError as e:
+                failed.append('{} (ImportError: {})'.format(module, e))
+    return {'top': profiler.top(), 'failed': failed}
+
+
+def measure_operations():
+    """Measure the first call of each lifecycle operation."""
+    import tempfile
+
+    import cfy.server as server
+    import cfy.sshkey as sshkey
+    from benchmarks.fakefco import FakeFCOServer
+    from cloudify.context import BootstrapContext
+    from cloudify.mocks import MockCloudifyContext
+
+    results = {}
+    with FakeFCOServer() as fco:
+        resources = fco.fco.seed()
+        auth = {'token': 'benchmark', 'url': fco.url}
+        bootstrap_context = BootstrapContext({'resources_prefix': 'bench-'})
+
+        key_ctx = MockCloudifyContext(
+            node_id='key', deployment_id='benchmark',
+            bootstrap_context=bootstrap_context,
+            properties={'auth': auth, 'use_existing': False,
+                        'resource_id': '', 'user': None, 'global': False,
+                        'private_key_path': os.path.join(tempfile.mkdtemp(),
+                                                         'id_rsa')})
+        # The fake control plane has no hosts to provision private keys on,
+        # public keys are created and attached with the server
+        properties = {'auth': auth, 'use_existing': False, 'resource_id': '',
+                      'cpu_count': 1, 'ram_amount': 512,
+                      'public_keys': ['ssh-rsa AAAA bench-1',
+                                      'ssh-rsa AAAA bench-2'],
+                      'private_keys': []}
+        properties.update(resources)
+        server_ctx = MockCloudifyContext(
+            node_id='server', deployment_id='benchmark',
+            bootstrap_context=bootstrap_context, properties=properties)
+
+        for name, operation, ctx in (
+                ('sshkey.create', sshkey.create, key_ctx),
+                ('sshkey.creation_validation', sshkey.creation_validation,
+                 key_ctx),
+                ('server.create', server.create, server_ctx),
+                ('server.stop', server.stop, server_ctx),
+                ('server.start', server.start, server_ctx),
+                ('server.creation_validation', server.creation_validation,
+                 server_ctx),
+                ('server.delete', server.delete, server_ctx),
+                ('sshkey.delete', sshkey.delete, key_ctx)):
+            requests = len(fco.fco.requests)
+            with Measurement() as m:
+                operation(ctx=ctx)
+            results[name] = (m.time, m.memory,
+                             len(fco.fco.requests) - requests)
+    return results
+
+
+CHILDREN = {
+    'import': measure_import,
+    'profile': profile_imports,
+    'operations': measure_operations,
+}
+
+
+def child(name, *args):
+    """Run a measurement and report its result to the parent process."""
+    import json
+    import traceback
+    try:
+        result = {'result': CHILDREN[name](*args)}
+    except Exception:
+        result = {'error': traceback.format_exc()}
+    sys.stdout.write('\n' + RESULT_PREFIX + json.dumps(result) + '\n')
+
+
+def run(name, *args):
+    """
+    Run a measurement in a fresh interpreter.
+
+    :param name: name of the measurement
+    :param args: measurement arguments
+    :return: dict with the result or the reason it is missing
+    """
+    import json
+    import subprocess
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    process = subprocess.Popen([sys.executable, '-m', 'benchmarks.coldstart',
+                                '--child', name] + list(args),
+                               cwd=root, stdout=subprocess.PIPE)
+    output = process.communicate()[0]
+    for line in reversed(output.splitlines()):
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    return {'error': 'No result, exit code {}'.format(process.returncode)}
+
+
+###############################################################################
+# Reporting
+###############################################################################
+
+def check(name, measured, threshold, scale):
+    """
+    Report a measurement against its threshold.
+
+    :param name: name of the measurement
+    :param measured: (time, memory) tuple
+    :param threshold: (time, memory) tuple
+    :param scale: factor to scale thresholds by
+    :return: True if within the threshold
+    """
+    time, memory = measured[:2]
+    max_time, max_memory = threshold[0] * scale, threshold[1] * scale
+    ok = time <= max_time and memory <= max_memory
+    print('{:<30}{:>9.1f} ms{:>8.1f} MB   (max {:.0f} ms, {:.0f} MB){}'.format(
+        name, time, memory, max_time, max_memory, '' if ok else '   FAIL'))
+    return ok
+
+
+def report_missing(name, result):
+    """
+    Report a measurement that has no result, e.g. as a module the plugin
+    needs is not installed.
+
+    :param name: name of the measurement
+    :param result: result reported by the measurement
+    :return: False, a missing measurement is a failure
+    """
+    print('{:<30}ERROR'.format(name))
+    print(result['error'])
+    return False
+
+
+def main(argv=None):
+    import argparse
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='fresh imports per module, the best is kept')
+    parser.add_argument('--scale', type=float, default=1.0,
+                        help='factor to scale all thresholds by')
+    args = parser.parse_args(argv)
+
+    ok = True
+
+    print('Imports (best of {})'.format(args.repeat))
+    for module in IMPORTS:
+        results = [run('import', module) for _ in range(args.repeat)]
+        measured = [r['result'][module] for r in results if 'result' in r]
+        if not measured:
+            ok &= report_missing(module, results[0])
+            continue
+        best = (min(m[0] for m in measured), min(m[1] for m in measured))
+        ok &= check(module, best, IMPORT_THRESHOLDS[module], args.scale)
+
+    print('\nFirst call of lifecycle operations')
+    result = run('operations')
+    if 'result' not in result:
+        ok &= report_missing('operations', result)
+    else:
+        for name, measured in sorted(result['result'].items(),
+                                     key=lambda r: r[0]):
+            ok &= check('{} ({} requests)'.format(name, measured[2]),
+                        measured, OPERATION_THRESHOLDS[name], args.scale)
+
+    print('\nImport attribution (profiled, self time)')
+    result = run('profile', *IMPORTS)
+    if 'result' not in result:
+        ok &= report_missing('attribution', result)
+    else:
+        print('{:>10}{:>12}{:>10}  {}'.format('self', 'cumulative',
+                                              'memory', 'module'))
+        for module, self_time, cumulative, memory in result['result']['top']:
+            print('{:>7.1f} ms{:>9.1f} ms{:>7.1f} MB  {}'.format(
+                self_time, cumulative, memory, module))
+        for failed in result['result']['failed']:
+            print('Not profiled: ' + failed)
+            ok = False
+
+    if not ok:
+        print('\nCold start benchmarks failed')
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(*sys.argv[2:])
+    else:
+        sys.exit(main())
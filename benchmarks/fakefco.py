@@ -0,0 +1,303 @@
+# coding=UTF-8
+
+"""Provides a fake FCO control plane to benchmark the plugin against.
+
+The fake keeps its resources in memory and serves the subset of the FCO REST
+API used by the plugin's lifecycle operations over HTTP, so requests pass
+through the real REST client, payload encoding and response validation. State
+changes are applied as they are requested, while the jobs requesting them can
+be set to take time to complete and every request can be delayed to simulate
+the latency of a real control plane.
+"""
+
+import json
+import re
+import socket
+import sys
+import threading
+import time
+from BaseHTTPServer import (BaseHTTPRequestHandler, HTTPServer)
+from SocketServer import ThreadingMixIn
+from itertools import count
+from urlparse import (parse_qsl, urlsplit)
+from uuid import UUID
+
+from fcoclient.clients import REST_API_VERSION
+
+URL_PREFIX = '/rest/user/{}/'.format(REST_API_VERSION)
+
+CLUSTER_UUID = '00000000-0000-4000-8000-0000000c1057'
+VDC_UUID = '00000000-0000-4000-8000-000000000fdc'
+
+# Fields every Job returned by the API has to define, besides the ones every
+# resource has
+JOB_FIELDS = ('endTime', 'errorCode', 'extendedType', 'info',
+              'itemDescription', 'itemName', 'itemType', 'itemUUID',
+              'jobType', 'parentJobUUID', 'scheduled', 'startTime', 'status',
+              'userName', 'userUUID')
+
+
+class FakeFCO(object):
+
+    """In-memory FCO control plane."""
+
+    def __init__(self, latency=0, job_time=0):
+        """
+        Initialise the control plane.
+
+        :param latency: seconds every request is delayed by
+        :param job_time: seconds every job takes to complete
+        """
+        self.latency = latency
+        self.job_time = job_time
+        self.resources = {}
+        self.requests = []
+        self._ids = count(1)
+        self._lock = threading.Condition()
+        # Completion times of jobs in progress
+        self._pending = {}
+        self.routes = [
+            ('POST', r'resources/(?:(?P<type>\w+)/)?list$', self.list),
+            ('GET', r'resources/(?:(?P<type>\w+)/)?list$', self.list),
+            ('POST', r'resources/(?P<type>server|sshkey|nic|disk|vdc|network)'
+                     r'$', self.create),
+            ('PUT', r'resources/server/(?P<server>[^/]+)/sshkey/'
+                    r'(?P<key>[^/]+)/attach$', self.attach_key),
+            ('PUT', r'resources/server/(?P<server>[^/]+)/nic/(?P<nic>[^/]+)/'
+                    r'attach$', self.attach_nic),
+            ('PUT', r'resources/server/(?P<server>[^/]+)/change_status$',
+             self.change_status),
+            ('GET', r'resources/job/(?P<job>[^/]+)/wait$', self.wait_for_job),
+            ('DELETE', r'resources/(?:\w+/)?(?P<uuid>[^/]+)$', self.delete),
+        ]
+
+    def uuid(self):
+        """Generate a new resource UUID."""
+        return str(UUID(int=next(self._ids)))
+
+    def add(self, type_, name=None, **fields):
+        """
+        Add an active resource.
+
+        :param type_: resource type, e.g. `SERVER`
+        :param name: resource name
+        :param fields: further resource fields
+        :return: resource
+        """
+        uuid = fields.pop('resourceUUID', None) or self.uuid()
+        resource = {'resourceUUID': uuid, 'resourceType': type_,
+                    'resourceName': name or uuid, 'resourceState': 'ACTIVE',
+                    'clusterUUID': CLUSTER_UUID, 'vdcUUID': VDC_UUID,
+                    'sortOrder': None}
+        resource.update(fields)
+        self.resources[uuid] = resource
+        return resource
+
+    def seed(self, image_size=20):
+        """
+        Add the resources a server deployment refers to.
+
+        :param image_size: image size in GB
+        :return: mapping of node property names to resource names
+        """
+        self.add('VDC', 'Bench VDC', resourceUUID=VDC_UUID)
+        self.add('IMAGE', 'Bench Image', size=image_size)
+        self.add('NETWORK', 'Bench Network', networkType='IP')
+        self.add('PRODUCTOFFER', 'Bench Server')
+        self.add('PRODUCTOFFER', '{} GB Storage Disk'.format(image_size))
+        self.add('SSHKEY', 'Bench Manager Key', publicKey='ssh-rsa AAAA')
+        return {'image': 'Bench Image', 'vdc': 'Bench VDC',
+                'network': 'Bench Network', 'server_type': 'Bench Server',
+                'manager_key': 'Bench Manager Key'}
+
+    def job(self, item, job_type):
+        """Add a successful job for an item."""
+        job = dict.fromkeys(JOB_FIELDS)
+        job.update(itemUUID=item['resourceUUID'],
+                   itemType=item['resourceType'],
+                   itemName=item['resourceName'], jobType=job_type,
+                   status='IN_PROGRESS' if self.job_time else 'SUCCESSFUL',
+                   scheduled=False)
+        job = self.add('JOB', None, **job)
+        if self.job_time:
+            self._pending[job['resourceUUID']] = time.time() + self.job_time
+        return job
+
+    def complete_jobs(self):
+        """Complete the jobs that are due."""
+        now = time.time()
+        for uuid, completes in self._pending.items():
+            if completes <= now:
+                self.resources[uuid]['status'] = 'SUCCESSFUL'
+                del self._pending[uuid]
+
+    def handle(self, verb, path, body):
+        """
+        Handle a REST request.
+
+        :param verb: HTTP verb
+        :param path: request path, without the query string
+        :param body: decoded request data
+        :return: (status code, response) tuple
+        """
+        if not path.startswith(URL_PREFIX):
+            return 404, {'message': 'Unknown API: {}'.format(path)}
+        path = path[len(URL_PREFIX):]
+        if self.latency:
+            time.sleep(self.latency)
+        with self._lock:
+            self.requests.append((verb, path))
+            self.complete_jobs()
+            for route_verb, pattern, f in self.routes:
+                match = re.match(pattern, path)
+                if route_verb == verb and match:
+                    try:
+                        return 200, f(body, **match.groupdict())
+                    except KeyError as e:
+                        return 404, {'message': 'No such resource: {}'
+                                                .format(e)}
+                    except NotImplementedError as e:
+                        return 501, {'message': 'Not implemented: {}'
+                                                .format(e)}
+        return 501, {'message': 'Not implemented: {} {}'.format(verb, path)}
+
+    def list(self, body, type=None):
+        conditions = body.get('searchFilter', {}).get('filterConditions', [])
+        results = []
+        for resource in self.resources.values():
+            if type is not None and resource['resourceType'] != type.upper():
+                continue
+            if all(self.matches(resource, c) for c in conditions):
+                results.append(resource)
+        return {'listFrom': 0, 'listTo': len(results),
+                'totalCount': len(results), 'list': results}
+
+    @staticmethod
+    def matches(resource, condition):
+        if condition['condition'] != 'IS_EQUAL_TO':
+            raise NotImplementedError(condition['condition'])
+        return str(resource.get(condition['field'])) in condition['value']
+
+    def create(self, body, type):
+        skeleton = dict(body.values()[0])
+        skeleton.pop('resourceUUID', None)
+        type_ = skeleton['resourceType']
+        if type_ == 'SERVER':
+            nics = skeleton.pop('nics', None) or []
+            skeleton.update(status='STOPPED', initialUser='bench',
+                            initialPassword='bench', nics=[],
+                            sshkeys=[self.resources[key.get('resourceUUID')]
+                                     if isinstance(key, dict) else
+                                     self.resources[key]
+                                     for key in skeleton.get('sshkeys', [])])
+            resource = self.add(type_, skeleton.pop('resourceName'),
+                                **skeleton)
+            # NIC skeletons are created attached to the server
+            for nic in nics:
+                nic = self.add_nic(dict(nic, serverUUID=resource[
+                    'resourceUUID']))
+                resource['nics'].append(nic)
+        elif type_ == 'NIC':
+            resource = self.add_nic(skeleton)
+        else:
+            resource = self.add(type_, skeleton.pop('resourceName'),
+                                **skeleton)
+        return self.job(resource, 'CREATE_' + type_)
+
+    def add_nic(self, skeleton):
+        """Add a NIC from its skeleton, assigning it an IP address."""
+        skeleton = dict(skeleton)
+        skeleton.pop('resourceUUID', None)
+        skeleton['ipAddresses'] = [{'ipAddress': '10.0.0.{}'.format(
+            len(self.resources) % 250 + 2)}]
+        return self.add('NIC', skeleton.pop('resourceName'), **skeleton)
+
+    def attach_key(self, body, server, key):
+        server = self.resources[server]
+        server['sshkeys'].append(self.resources[key])
+        return self.job(server, 'ATTACH_SSHKEY')
+
+    def attach_nic(self, body, server, nic):
+        server, nic = self.resources[server], self.resources[nic]
+        nic['serverUUID'] = server['resourceUUID']
+        server['nics'].append(nic)
+        return self.job(server, 'ATTACH_NIC')
+
+    def change_status(self, body, server):
+        server = self.resources[server]
+        server['status'] = body['newStatus']
+        if body['newStatus'] == 'RUNNING':
+            return self.job(server, 'START_SERVER')
+        return self.job(server, 'SHUTDOWN_SERVER')
+
+    def wait_for_job(self, body, job):
+        while job in self._pending:
+            # Releases the lock while waiting
+            self._lock.wait(self._pending[job] - time.time())
+            self.complete_jobs()
+        return self.resources[job]
+
+    def delete(self, body, uuid):
+        resource = self.resources.pop(uuid)
+        return self.job(resource, 'DELETE_' + resource['resourceType'])
+
+
+class FakeFCOHandler(BaseHTTPRequestHandler):
+
+    """HTTP request handler for the fake control plane."""
+
+    def _handle(self):
+        # The client sends POST data as JSON, PUT data form-encoded and GET and
+        # DELETE data in the query string
+        url = urlsplit(self.path)
+        body = dict(parse_qsl(url.query))
+        length = int(self.headers.getheader('content-length') or 0)
+        if length:
+            content = self.rfile.read(length)
+            try:
+                body.update(json.loads(content))
+            except ValueError:
+                body.update(parse_qsl(content))
+        status, response = self.server.fco.handle(self.command, url.path,
+                                                  body)
+        content = json.dumps(response)
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_DELETE = _handle
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeFCOServer(ThreadingMixIn, HTTPServer):
+
+    """HTTP server for the fake control plane, serving from a thread."""
+
+    daemon_threads = True
+
+    def __init__(self, fco=None, address=('127.0.0.1', 0)):
+        HTTPServer.__init__(self, address, FakeFCOHandler)
+        self.fco = fco or FakeFCO()
+        self.thread = threading.Thread(target=self.serve_forever)
+        self.thread.daemon = True
+
+    def handle_error(self, request, client_address):
+        # Clients may give up on requests, e.g. once they time out
+        if not isinstance(sys.exc_info()[1], socket.error):
+            HTTPServer.handle_error(self, request, client_address)
+
+    @property
+    def url(self):
+        return 'http://{}:{}'.format(*self.server_address)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.shutdown()
+        self.server_close()
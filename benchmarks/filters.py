@@ -0,0 +1,109 @@
+# coding=UTF-8
+
+"""Benchmark constructing search filters from Complex Object fields.
+
+Run from the repository root with `python -m benchmarks.filters`.
+"""
+
+from __future__ import print_function
+
+import gc
+from timeit import default_timer
+
+import resttypes.cobjects as cobjects
+import resttypes.enums as enums
+from resttypes.cobjects import (ComplexField, ComplexMeta)
+
+FILTER_COUNT = 10000
+
+STATE = enums.ResourceState.ACTIVE
+
+
+class UncachedMeta(ComplexMeta):
+
+    """Reference metaclass, creating fields as before they were cached."""
+
+    def __getattr__(cls, item):
+        if not hasattr(cls, 'ALL_ATTRIBS'):
+            raise AttributeError('No fields defined in Complex Object \'{}\''
+                                 .format(cls.__name__))
+        if item in cls.ALL_ATTRIBS:
+            return ComplexField(item, lambda v: cls.untype.__func__(None, v))
+        raise AttributeError('No such field in Complex Object \'{}\''.format(
+            cls.__name__))
+
+
+R = cobjects.Resource
+UncachedR = UncachedMeta('Resource', (R,), {})
+
+
+def cached_filter(uuid):
+    """Filter as built by wait_for_state and get_resource."""
+    return (R.resourceUUID == uuid) & (R.resourceState == STATE)
+
+
+def uncached_filter(uuid):
+    """Reference filter, building its fields without the cache."""
+    return ((UncachedR.resourceUUID == uuid) &
+            (UncachedR.resourceState == STATE))
+
+
+def timed(f, data):
+    """
+    Time applying f to every element of data.
+
+    :param f: function to apply
+    :param data: data to apply f to
+    :return: elapsed time in seconds
+    """
+    start = default_timer()
+    for inst in data:
+        f(inst)
+    return default_timer() - start
+
+
+def allocations(f, count=1000):
+    """
+    Count objects tracked by the garbage collector that f allocates.
+
+    :param f: function to apply
+    :param count: number of applications, results are kept alive throughout
+    :return: new objects per application
+    """
+    kept = []
+    gc.collect()
+    gc.disable()
+    try:
+        before = len(gc.get_objects())
+        for _ in range(count):
+            kept.append(f())
+        return (len(gc.get_objects()) - before) / float(count)
+    finally:
+        gc.enable()
+
+
+def main():
+    uuids = ['uuid-{}'.format(i) for i in range(FILTER_COUNT)]
+    assert (cached_filter(uuids[0])[0]._data ==
+            uncached_filter(uuids[0])[0]._data)
+
+    results = [
+        ('field access, uncached',
+         timed(lambda _: UncachedR.resourceUUID, uuids)),
+        ('field access, cached', timed(lambda _: R.resourceUUID, uuids)),
+        ('filter, uncached fields', timed(uncached_filter, uuids)),
+        ('filter, cached fields', timed(cached_filter, uuids)),
+    ]
+
+    print('{} filters'.format(len(uuids)))
+    for name, elapsed in results:
+        print('{:<40}{:>8.1f} ms'.format(name, elapsed * 1000))
+    for name, f in (
+            ('objects per field access, uncached',
+             lambda: UncachedR.resourceUUID),
+            ('objects per field access, cached', lambda: R.resourceUUID)):
+        print('{:<40}{:>8.2f}'.format(name, allocations(f)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,147 @@
+# coding=UTF-8
+
+"""Benchmark the memory of creating typed containers in a loop.
+
+Containers whose types are set per instance, rather than by a generated class,
+store those types through `typed.ImmutableType`. Each round keeps its
+containers alive until it ends, as an operation would keep a result set. The
+resident set size should stay flat from round to round, as the types are
+freed with their containers.
+
+Compact, slotted Complex Objects, as generated with
+`generators.cobjects.gen(..., slots=True)`, are then compared to the generated
+dict-backed ones, which they should behave like while taking less memory.
+
+Run from the repository root with `python -m benchmarks.memory`.
+"""
+
+from __future__ import print_function
+
+import gc
+import resource
+import sys
+
+from resttypes import cobjects
+from typed import (TypedList, TypedDict)
+from typed.factories import (List, Dict)
+
+ROUNDS = 10
+CONTAINERS_PER_ROUND = 20000
+OBJECTS = 50000
+
+# Growth in MB between the first and the last round considered flat
+GROWTH_THRESHOLD = 2.0
+
+
+def rss():
+    """Current resident set size of the process in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            pages = int(f.read().split()[1])
+        return pages * resource.getpagesize() / 1024.0 ** 2
+    except IOError:
+        # No procfs, fall back to the peak resident set size
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Reported in bytes on OS X and in kilobytes elsewhere
+        return rss / 1024.0 ** (2 if sys.platform == 'darwin' else 1)
+
+
+def create_containers(count=CONTAINERS_PER_ROUND):
+    """
+    Create typed containers.
+
+    :param count: number of containers of each kind
+    :return: list of the containers
+    """
+    containers = []
+    for i in range(count):
+        containers.append(TypedList([i], item_type=int))
+        containers.append(TypedDict({'k': i}, key_type=str, item_type=int))
+        containers.append(List(int)([i]))
+        containers.append(Dict(str, int)({'k': i}))
+    return containers
+
+
+def slotted(cls):
+    """
+    Get the slotted equivalent of a generated Complex Object class.
+
+    :param cls: generated Complex Object class
+    :return: class the generator emits for it with `slots=True`
+    """
+    return type(cls.__name__, (cobjects.SlottedComplexObject,), {
+        'ALL_ATTRIBS': cls.ALL_ATTRIBS,
+        'REQUIRED_ATTRIBS': cls.REQUIRED_ATTRIBS,
+        'OPTIONAL_ATTRIBS': cls.OPTIONAL_ATTRIBS,
+        'TYPES': cls.TYPES,
+        '__slots__': tuple(sorted(cls.ALL_ATTRIBS))})
+
+
+def ssh_key(cls, i):
+    return cls(resourceUUID='00000000-0000-4000-8000-{:012d}'.format(i),
+               resourceName='Key {}'.format(i), publicKey='ssh-rsa AAAA',
+               globalKey=False, customerUUID='customer', vdcUUID='vdc')
+
+
+def measure_objects(cls, count=OBJECTS):
+    """
+    Measure the memory of Complex Objects kept alive.
+
+    :param cls: Complex Object class
+    :param count: number of objects
+    :return: (objects, growth of the RSS in MB) tuple
+    """
+    gc.collect()
+    before = rss()
+    objects = [ssh_key(cls, i) for i in range(count)]
+    gc.collect()
+    return objects, rss() - before
+
+
+def compare_objects():
+    """Compare slotted to dict-backed Complex Objects, 0 if smaller."""
+    compact = slotted(cobjects.SSHKey)
+    dict_backed, compact_key = ssh_key(cobjects.SSHKey, 0), ssh_key(compact, 0)
+    if hasattr(compact_key, '__dict__'):
+        print('Slotted Complex Objects have a __dict__')
+        return 1
+    if (sorted(compact_key.items()) != sorted(dict_backed.items()) or
+            compact_key.untype() != dict_backed.untype()):
+        print('Slotted Complex Objects differ from dict-backed ones')
+        return 1
+
+    print('{} Complex Objects'.format(OBJECTS))
+    # Both kept alive, so neither reuses memory freed by the other
+    dict_keys, dict_mb = measure_objects(cobjects.SSHKey)
+    compact_keys, compact_mb = measure_objects(compact)
+    print('{:>12}{:>9.1f} MB'.format('dict-backed', dict_mb))
+    print('{:>12}{:>9.1f} MB'.format('slotted', compact_mb))
+    del dict_keys, compact_keys
+    if compact_mb >= dict_mb:
+        print('Slotted Complex Objects take no less memory')
+        return 1
+    return 0
+
+
+def main():
+    print('{} rounds of {} containers of each kind'.format(
+        ROUNDS, CONTAINERS_PER_ROUND))
+    print('{:>6}{:>12}'.format('round', 'RSS'))
+    measured = []
+    for n in range(ROUNDS):
+        containers = create_containers()
+        del containers
+        gc.collect()
+        measured.append(rss())
+        print('{:>6}{:>9.1f} MB'.format(n + 1, measured[-1]))
+
+    growth = measured[-1] - measured[0]
+    print('Growth after the first round: {:.1f} MB'.format(growth))
+    if growth > GROWTH_THRESHOLD:
+        print('RSS grows by more than {:.1f} MB'.format(GROWTH_THRESHOLD))
+        return 1
+    return compare_objects()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
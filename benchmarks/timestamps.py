@@ -0,0 +1,84 @@
+# coding=UTF-8
+
+"""Benchmark FCO timestamp parsing.
+
+Run from the repository root with `python -m benchmarks.timestamps`.
+"""
+
+from __future__ import print_function
+
+from datetime import datetime, timedelta
+from timeit import default_timer
+
+import resttypes
+from resttypes import (construct_data, is_acceptable, parse_timestamp)
+
+TIMESTAMP_COUNT = 10000
+
+
+def timestamps(count=TIMESTAMP_COUNT):
+    """
+    Generate distinct FCO timestamps.
+
+    :param count: number of timestamps
+    :return: list of timestamp strings
+    """
+    start = datetime(2015, 1, 1)
+    return [(start + timedelta(seconds=17 * i)).strftime('%Y-%m-%dT%H:%M:%S') +
+            '+0000' for i in range(count)]
+
+
+def strptime_parse(inst):
+    """Reference parser, as used before parse_timestamp."""
+    tzless = datetime.strptime(inst[:-5], '%Y-%m-%dT%H:%M:%S')
+    return tzless + timedelta(hours=int(inst[-4:-2]), minutes=int(inst[-2:]))
+
+
+def timed(f, data):
+    """
+    Time applying f to every element of data.
+
+    :param f: function to apply
+    :param data: data to apply f to
+    :return: elapsed time in seconds
+    """
+    start = default_timer()
+    for inst in data:
+        f(inst)
+    return default_timer() - start
+
+
+def clear_cache():
+    """Empty the timestamp cache."""
+    resttypes.clear_timestamp_cache()
+
+
+def validate_and_construct(inst):
+    """Validate and then construct a datetime field, as Complex Objects do."""
+    is_acceptable(inst, datetime, True)
+    return construct_data(inst, datetime, True)
+
+
+def main():
+    data = timestamps()
+    assert all(parse_timestamp(t) == strptime_parse(t) for t in data)
+
+    results = [('strptime', timed(strptime_parse, data))]
+
+    clear_cache()
+    results.append(('parse_timestamp (cold)', timed(parse_timestamp, data)))
+
+    clear_cache()
+    results.append(('validate + construct, strptime',
+                    timed(lambda t: (strptime_parse(t), strptime_parse(t)),
+                          data)))
+    results.append(('validate + construct, parse_timestamp',
+                    timed(validate_and_construct, data)))
+
+    print('{} timestamps'.format(len(data)))
+    for name, elapsed in results:
+        print('{:<40}{:>8.1f} ms'.format(name, elapsed * 1000))
+
+
+if __name__ == '__main__':
+    main()
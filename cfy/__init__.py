@@ -3,7 +3,11 @@
 """Provides a wrapper that functions as the Cloudify interface."""
 
 from __future__ import print_function
+import re
 from resttypes import cobjects, enums
+import fcoclient.exceptions as fco_exceptions
+from cfy.polling import poll
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from time import sleep
 from datetime import datetime, timedelta
@@ -14,6 +18,18 @@ __author__ = 'alen'
 RT = enums.ResourceType
 R = cobjects.Resource
 
+# Resource UUIDs issued by FCO, any other identifier can only be a name
+UUID_PATTERN = re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-'
+                          r'[0-9a-f]{12}$', re.IGNORECASE)
+
+# Maximum number of API calls made concurrently by a single operation
+MAX_WORKERS = 8
+
+# Seconds to wait for a job with a single request, and to first wait before
+# checking a job again when polling
+JOB_WAIT_TIMEOUT = 60
+JOB_POLL_DELAY = 0.5
+
 
 ###############################################################################
 # Exceptions
@@ -46,6 +62,19 @@ class ConflictingResourceError(Exception):
             self.results, self.res_type, self.query)
 
 
+class ConcurrentCallsFailed(Exception):
+
+    """Exception raised when several concurrent calls failed."""
+
+    def __init__(self, errors):
+        self.errors = errors
+
+    def __str__(self):
+        return 'Multiple calls failed: {}'.format('; '.join(
+            '{}: {}: {}'.format(name, type(e).__name__, e)
+            for name, e in sorted(self.errors.items())))
+
+
 class TaskStartError(Exception):
 
     """Exception raised when Task cannot start."""
@@ -70,26 +99,38 @@ class JobTimedout(Exception):
 # Job scheduling and dependencies
 ###############################################################################
 
-def created_uuid_from_job(f, timeout=300, check_rate=3):
+def created_uuid_from_job(f, timeout=300, check_rate=3,
+                          wait_timeout=JOB_WAIT_TIMEOUT):
     """
     Fetch item UUID from using a function that returns a Job or Job-compatible
     object. If a timeout is specified the Job will be cancelled if not
     successful within the timeout period, with an error margin of the check
     rate.
 
+    The Job is waited for server-side using waitForJob, with the wait bounded
+    by the wait timeout. Should the wait fail or time out the Job is polled
+    instead, doubling the time between checks up to the check rate. If the
+    wrapped function is passed a `job_watcher`, e.g. a `cfy.jobs.JobWatcher`,
+    the Job is watched by it instead.
+
     :param f: function to wrap
     :param timeout: time in seconds to wait before cancelling the job
     :param check_rate: time in seconds to wait before checking job status
+    :param wait_timeout: time in seconds to wait for the job server-side
     :return: function wrapper
     """
     @wraps(f)
     def wrapper(fco_api, *args, **kwargs):
         # Timeout and check rate
         f_cancel = datetime.now() + timedelta(seconds=timeout)
-        f_check_rate = check_rate
+        f_check_rate = min(JOB_POLL_DELAY, check_rate)
+        f_wait = True
+        job_watcher = kwargs.pop('job_watcher', None)
 
         # Execute creation query
         result = f(fco_api, *args, **kwargs)
+        if job_watcher is not None:
+            return job_watcher.watch(result, timeout).result().itemUUID
 
         while True:
             status = enums.JobStatus(result.status)
@@ -99,9 +140,23 @@ def created_uuid_from_job(f, timeout=300, check_rate=3):
                 raise JobCancelled(result.resourceUUID)
             elif status == enums.JobStatus.SUCCESSFUL:
                 return result.itemUUID
-            if datetime.now() > f_cancel:
+            remaining = (f_cancel - datetime.now()).total_seconds()
+            if remaining <= 0:
                 raise JobTimedout(result.resourceUUID)
-            sleep(f_check_rate)
+            if f_wait:
+                # Polled from now on, unless the wait returns a finished job
+                f_wait = False
+                try:
+                    result = fco_api.prepare(
+                        'WaitForJob', jobUUID=result.resourceUUID,
+                        noWaitForChildren=False)(
+                        timeout=min(wait_timeout, remaining))
+                    continue
+                except (fco_exceptions.RecoverableError,
+                        fco_exceptions.NonRecoverableError):
+                    pass
+            sleep(min(f_check_rate, remaining))
+            f_check_rate = min(f_check_rate * 2, check_rate)
             result = get_resource(fco_api, result.resourceUUID, 'JOB')
     return wrapper
 
@@ -120,72 +175,150 @@ def get_token(fco_api):
     return fco_api.getAuthenticationToken(automaticallyRenew=True).publicToken
 
 
+def _call_all(calls, max_workers):
+    """Call functions concurrently, getting their results and exceptions."""
+    with ThreadPoolExecutor(max(1, min(len(calls), max_workers))) as executor:
+        futures = {name: executor.submit(f) for name, f in calls.items()}
+
+    results, errors = {}, {}
+    for name, future in futures.items():
+        if future.exception() is None:
+            results[name] = future.result()
+        else:
+            errors[name] = future.exception_info()
+    return results, errors
+
+
+def call_concurrently(calls, max_workers=MAX_WORKERS):
+    """
+    Call functions concurrently, waiting for all of them to return. If a
+    single call fails its exception is re-raised, if several calls fail a
+    `ConcurrentCallsFailed` with all their exceptions is raised.
+
+    :param calls: Mapping of names to functions taking no arguments
+    :param max_workers: Maximum number of concurrent calls
+    :return: Mapping of names to return values
+    """
+    results, errors = _call_all(calls, max_workers)
+    if len(errors) == 1:
+        e, tb = errors.values()[0]
+        raise type(e), e, tb
+    elif errors:
+        raise ConcurrentCallsFailed({name: e for name, (e, _) in
+                                     errors.items()})
+    return results
+
+
 def list_resource(fco_api, conditions, resource_type=None, **limits):
+    return prepare_list_resource(fco_api, conditions, resource_type,
+                                 **limits)()
+
+
+def prepare_list_resource(fco_api, conditions, resource_type=None, **limits):
+    """
+    Prepare a resource listing query, to be performed repeatedly.
+
+    :param fco_api: FCO API object
+    :param conditions: Filter conditions
+    :param resource_type: Resource type (optional)
+    :param limits: Query limits
+    :return: Prepared query returning a list result
+    """
     ql = cobjects.QueryLimit(**limits)
     if not isinstance(conditions, list):
         conditions = [conditions]
     sf = cobjects.SearchFilter(filterConditions=conditions)
     if resource_type is None:
-        return fco_api.listResources(searchFilter=sf, queryLimit=ql)
-    return fco_api.listResources(searchFilter=sf, queryLimit=ql,
-                                 resourceType=resource_type)
+        return fco_api.prepare('ListResources', searchFilter=sf,
+                               queryLimit=ql)
+    return fco_api.prepare('ListResources', searchFilter=sf, queryLimit=ql,
+                           resourceType=resource_type)
 
 
-def wait_for_state(fco_api, res_uuid, state, res_type, time=5, step=24):
+def transition_key(res_type, conditions):
     """
-    SSC-recommended state checking function.
+    Get the key a transition is recorded under in the latency model.
+
+    :param res_type: Resource type
+    :param conditions: Filter conditions the transition ends with
+    :return: Transition key
+    """
+    if not isinstance(conditions, list):
+        conditions = [conditions]
+    return (str(res_type),) + tuple((c.field, str(c.condition), tuple(c.value))
+                                    for c in conditions)
+
+
+def wait_for_state(fco_api, res_uuid, state, res_type, time=5, step=24,
+                   transition=None):
+    """
+    SSC-recommended state checking function, see `cfy.polling.poll` for how
+    tries are scheduled.
 
     :param fco_api: FCO API object
     :param res_uuid: Resource UUID to monitor
     :param state: Desired resource state
     :param res_type: Resource type
-    :param time: Time to wait before tries in seconds
-    :param step: Number of tries
+    :param time: Maximum time to wait between tries in seconds
+    :param step: Number of tries at the maximum time to wait for
+    :param transition: Transition key, defaults to the type and state
     :return: True if desired state is reached, False otherwise
     """
-    filter_ = (R.resourceUUID == res_uuid) & (R.resourceState == state)
-    result_set = list_resource(fco_api, filter_, res_type)
-
-    while step and not result_set.totalCount:
-        result_set = list_resource(fco_api, filter_, res_type)
-        sleep(time)
-        step -= 1
-
-    return bool(result_set.totalCount)
+    cond = R.resourceState == state
+    query = prepare_list_resource(fco_api, (R.resourceUUID == res_uuid) & cond,
+                                  res_type)
+    if transition is None:
+        transition = transition_key(res_type, cond)
+    return bool(poll(lambda: query().totalCount, time * step, transition,
+                     maximum=time))
 
 
-def wait_for_cond(fco_api, res_uuid, cond, res_type, time=5, step=24):
+def wait_for_cond(fco_api, res_uuid, cond, res_type, time=5, step=24,
+                  transition=None):
     """
-    SSC-recommended status checking function.
+    SSC-recommended status checking function, see `cfy.polling.poll` for how
+    tries are scheduled.
 
     :param fco_api: FCO API object
     :param res_uuid: Resource UUID to monitor
     :param cond: Desired condition to be satisfied
     :param res_type: Resource type
-    :param time: Time to wait before tries in seconds
-    :param step: Number of tries
+    :param time: Maximum time to wait between tries in seconds
+    :param step: Number of tries at the maximum time to wait for
+    :param transition: Transition key, defaults to the type and condition
     :return: True if desired status is reached, False otherwise
     """
-    filter_ = (R.resourceUUID == res_uuid) & cond
-    result_set = list_resource(fco_api, filter_, res_type)
+    query = prepare_list_resource(fco_api, (R.resourceUUID == res_uuid) & cond,
+                                  res_type)
+    if transition is None:
+        transition = transition_key(res_type, cond)
+    return bool(poll(lambda: query().totalCount, time * step, transition,
+                     maximum=time))
 
-    while step and not result_set.totalCount:
-        result_set = list_resource(fco_api, filter_, res_type)
-        sleep(time)
-        step -= 1
 
-    return bool(result_set.totalCount)
+def is_uuid(res_id):
+    """
+    Check whether an identifier is shaped like a resource UUID.
+
+    :param res_id: Resource name or UUID
+    :return: True if `res_id` could be a resource UUID
+    """
+    return (isinstance(res_id, basestring) and
+            UUID_PATTERN.match(res_id) is not None)
 
 
 def get_resource(fco_api, res_id, res_type=None,
                  res_state=enums.ResourceState.ACTIVE, force_uuid=False):
     """
-    Get a resource by first checking for a resource with the name `res_id`.
-    If no results or multiple results are found, the next check is performed
-    for a resource with the UUID `res_id`. If a resource is found, it is
-    returned. If no resource and multiple resources were found with the name
-    query, a `ConflictingResourceError` is raised, otherwise a
-    `NoResourceError` is raised.
+    Get a resource by its UUID `res_id`, or failing that by its name `res_id`.
+    If exactly one resource has the UUID it is returned, otherwise if exactly
+    one resource has the name it is returned. If multiple resources have the
+    name a `ConflictingResourceError` is raised, otherwise a `NoResourceError`
+    is raised.
+
+    Identifiers not shaped like a UUID are only looked up by name. Those
+    shaped like one are looked up by UUID, and by name only if that finds
+    nothing, so most lookups take a single query.
 
     :param fco_api: FCI API object
     :param res_id: Resource name or UUID
@@ -205,16 +338,18 @@ def get_resource(fco_api, res_id, res_type=None,
         def _list_resource(filter_):
             return list_resource(fco_api, filter_).list
 
-    if not force_uuid:
-        named = _list_resource(filter_name)
+    if force_uuid or is_uuid(res_id):
+        uuided = _list_resource(filter_uuid)
+        if len(uuided) == 1:
+            return uuided[0]
+        # Deliberately serial: names shaped like a UUID are rare, and looking
+        # them up concurrently would double the queries of every UUID lookup
+        named = [] if force_uuid else _list_resource(filter_name)
     else:
-        named = []
-
-    uuided = _list_resource(filter_uuid)
+        # Identifiers not shaped like a UUID cannot match one
+        named = _list_resource(filter_name)
 
-    if len(uuided) == 1:
-        return uuided[0]
-    elif len(named) == 1:
+    if len(named) == 1:
         return named[0]
     elif len(named):
         raise ConflictingResourceError(res_type, filter_name,
@@ -490,7 +625,7 @@ def create_server_with_skeletons(fco_api, server_po_id, image_id, vdc_id,
 @created_uuid_from_job
 def create_server(fco_api, server_po_uuid, image_uuid, cluster_uuid, vdc_uuid,
                   cpu_count, ram_amount, boot_disk_po_uuid, keys_uuid=(),
-                  name=None):
+                  name=None, disk_size=None, nic_skeletons=()):
     """
     Create server.
 
@@ -502,8 +637,12 @@ def create_server(fco_api, server_po_uuid, image_uuid, cluster_uuid, vdc_uuid,
     :param cpu_count: Server CPU count
     :param ram_amount: Server RAM amount
     :param boot_disk_po_uuid: Server boot disk product offer UUID
-    :param keys_uuid: SSH keys to provision
+    :param keys_uuid: SSH keys to provision, SSH key UUIDs or SSHKey-compatible
+        objects
     :param name: Server name
+    :param disk_size: Server boot disk size, defaults to the image size
+    :param nic_skeletons: Server NIC skeletons, to create NICs attached to the
+        server with the same job
     :return: Job-compatible object
     """
     if name is None:
@@ -511,9 +650,12 @@ def create_server(fco_api, server_po_uuid, image_uuid, cluster_uuid, vdc_uuid,
         disk_name = 'DISK ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     else:
         disk_name = name + ' Disk'
-    disk_size = get_resource(fco_api, image_uuid, RT.IMAGE).size
+    if disk_size is None:
+        disk_size = get_resource(fco_api, image_uuid, RT.IMAGE).size
     if not isinstance(keys_uuid, list):
         keys_uuid = [keys_uuid]
+    keys = [cobjects.SSHKey(resourceUUID=key)
+            if isinstance(key, basestring) else key for key in keys_uuid]
     disk = cobjects.Disk(storageCapabilities=None, clusterUUID=None,
                          resourceType=RT.DISK, iso=False, sortOrder=None,
                          vdcUUID=vdc_uuid, resourceName=disk_name,
@@ -524,10 +666,97 @@ def create_server(fco_api, server_po_uuid, image_uuid, cluster_uuid, vdc_uuid,
                              vdcUUID=vdc_uuid, resourceName=name,
                              productOfferUUID=server_po_uuid,
                              imageUUID=image_uuid, cpu=cpu_count,
-                             ram=ram_amount, sshkeys=keys_uuid)
+                             ram=ram_amount, sshkeys=keys,
+                             nics=list(nic_skeletons))
     return fco_api.createServer(skeletonServer=server)
 
 
+def create_servers(fco_api, specs, resolve=get_resource,
+                   max_workers=MAX_WORKERS, job_watcher=None):
+    """
+    Create servers with a NIC each as a batch.
+
+    Configuration shared by the servers is resolved once, after which the
+    servers are created concurrently, each with its NIC in a single job. As
+    each server becomes active it is started.
+
+    :param fco_api: FCO API object
+    :param specs: Server specifications, dicts with the keys `server_po`,
+        `image`, `vdc` and `network` (names or UUIDs), `cpu_count`,
+        `ram_amount`, `name` and optionally `keys` (names or UUIDs)
+    :param resolve: Function getting a resource by name or UUID, with the
+        signature of `get_resource`
+    :param max_workers: Maximum number of servers created concurrently
+    :param job_watcher: Job watcher to wait for jobs with (optional)
+    :return: List of results in the order of the specifications, dicts with
+        the `uuid`, `nic` and `ip` of a server, or the `error` creating it
+        failed with
+    """
+    def resolve_image(image_id):
+        def f():
+            image = resolve(fco_api, image_id, RT.IMAGE)
+            # TODO: better way of determining suitable disk
+            boot_disk_po = resolve(fco_api, '{} GB Storage Disk'.format(
+                image.size), RT.PRODUCTOFFER)
+            return image, boot_disk_po
+        return f
+
+    def resolve_single(res_id, res_type):
+        return lambda: resolve(fco_api, res_id, res_type)
+
+    def lookups(spec):
+        return ([(spec['image'], RT.IMAGE), (spec['vdc'], RT.VDC),
+                 (spec['network'], RT.NETWORK),
+                 (spec['server_po'], RT.PRODUCTOFFER)] +
+                [(key, RT.SSHKEY) for key in spec.get('keys', ())])
+
+    # Resolve shared configuration once
+    calls = {}
+    for spec in specs:
+        for res_id, res_type in lookups(spec):
+            if res_type == RT.IMAGE:
+                calls[res_id, res_type] = resolve_image(res_id)
+            else:
+                calls[res_id, res_type] = resolve_single(res_id, res_type)
+    config, config_errors = _call_all(calls, max_workers)
+
+    def provision(spec):
+        for lookup in lookups(spec):
+            if lookup in config_errors:
+                e, tb = config_errors[lookup]
+                raise type(e), e, tb
+        image, boot_disk_po = config[spec['image'], RT.IMAGE]
+        vdc = config[spec['vdc'], RT.VDC]
+        network = config[spec['network'], RT.NETWORK]
+        server_po = config[spec['server_po'], RT.PRODUCTOFFER]
+        keys = [config[key, RT.SSHKEY] for key in spec.get('keys', ())]
+
+        nic = nic_skeleton(vdc.clusterUUID, network.networkType,
+                           network.resourceUUID, vdc.resourceUUID,
+                           spec['name'] + ' NIC')
+        server_uuid = create_server(
+            fco_api, server_po.resourceUUID, image.resourceUUID,
+            vdc.clusterUUID, vdc.resourceUUID, spec['cpu_count'],
+            spec['ram_amount'], boot_disk_po.resourceUUID, keys,
+            spec['name'], disk_size=image.size, nic_skeletons=[nic],
+            job_watcher=job_watcher)
+        if not wait_for_state(fco_api, server_uuid,
+                              enums.ResourceState.ACTIVE, RT.SERVER):
+            raise Exception('Server failed to prepare in time!')
+        if not start_server(fco_api, server_uuid):
+            raise Exception('Running server failed to complete in time!')
+
+        nic = get_resource(fco_api, server_uuid, RT.SERVER).nics[0]
+        return {'uuid': server_uuid, 'nic': nic.resourceUUID,
+                'ip': nic.ipAddresses[0].ipAddress}
+
+    results, errors = _call_all({i: (lambda spec=spec: provision(spec))
+                                 for i, spec in enumerate(specs)},
+                                max_workers)
+    return [results[i] if i in results else {'error': errors[i][0]}
+            for i in range(len(specs))]
+
+
 ###############################################################################
 # Disk stuff
 ###############################################################################
@@ -586,6 +815,25 @@ def detach_disk(fco_api, server_uuid, disk_uuid):
 # NIC stuff
 ###############################################################################
 
+def nic_skeleton(cluster_uuid, net_type, net_uuid, vdc_uuid, name=None):
+    """
+    Build NIC skeleton.
+
+    :param cluster_uuid: Cluster UUID
+    :param net_type: Network type; currently recommended 'IP'
+    :param net_uuid: Network UUID
+    :param vdc_uuid: VDC UUID
+    :param name: NIC name
+    :return: NIC skeleton
+    """
+    if name is None:
+        name = 'NIC ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    return cobjects.Nic(clusterUUID=cluster_uuid, networkUUID=net_uuid,
+                        vdcUUID=vdc_uuid, resourceType=RT.NIC,
+                        serverUUID=None, sortOrder=None, networkType=net_type,
+                        resourceName=name)
+
+
 @created_uuid_from_job
 def create_nic(fco_api, cluster_uuid, net_type, net_uuid, vdc_uuid, name=None):
     """
@@ -599,13 +847,7 @@ def create_nic(fco_api, cluster_uuid, net_type, net_uuid, vdc_uuid, name=None):
     :param name: NIC name
     :return: Job-compatible object
     """
-    if name is None:
-        name = 'NIC ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-    nic_data = cobjects.Nic(clusterUUID=cluster_uuid, networkUUID=net_uuid,
-                            vdcUUID=vdc_uuid, resourceType=RT.NIC,
-                            serverUUID=None, sortOrder=None,
-                            networkType=net_type,
-                            resourceName=name)
+    nic_data = nic_skeleton(cluster_uuid, net_type, net_uuid, vdc_uuid, name)
     return fco_api.createNetworkInterface(skeletonNIC=nic_data)
 
 
@@ -662,6 +904,26 @@ def create_ssh_key(fco_api, public_key, user=None, global_=False, name=None):
     return fco_api.createSSHKey(skeletonSSHKey=key)
 
 
+def create_ssh_keys(fco_api, public_keys, name=None,
+                    max_workers=MAX_WORKERS, job_watcher=None):
+    """
+    Create SSH keys concurrently.
+
+    :param fco_api: FCO API object
+    :param public_keys: Public key strings
+    :param name: SSH Key name
+    :param max_workers: Maximum number of keys created concurrently
+    :param job_watcher: Job watcher to wait for the jobs with together
+        (optional)
+    :return: List of SSH key UUIDs in the order of the public keys
+    """
+    results = call_concurrently(
+        {i: (lambda key=key: create_ssh_key(fco_api, key, name=name,
+                                            job_watcher=job_watcher))
+         for i, key in enumerate(public_keys)}, max_workers)
+    return [results[i] for i in range(len(public_keys))]
+
+
 def attach_ssh_key(fco_api, server_uuid, key_uuid):
     """
     Attach SSH key to server.
@@ -7,7 +7,7 @@ from cloudify.exceptions import (NonRecoverableError, RecoverableError)
 
 from functools import wraps
 
-from cfy import NoResourceError
+from cfy import (NoResourceError, ConcurrentCallsFailed)
 from fcoclient.clients import (get_client, RESTClient, PROP_CLIENT_CONFIG)
 from fcoclient.api import REST as RESTApi
 import fcoclient.exceptions as fco_exceptions
@@ -123,6 +123,13 @@ def with_exceptions_handled(f):
             raise NonRecoverableError(str(e))
         except fco_exceptions.RecoverableError as e:
             raise RecoverableError(str(e), retry_after=e.retry_after)
+        except ConcurrentCallsFailed as e:
+            errors = e.errors.values()
+            if all(isinstance(error, fco_exceptions.RecoverableError)
+                   for error in errors):
+                raise RecoverableError(str(e), retry_after=max(
+                    error.retry_after for error in errors))
+            raise NonRecoverableError(str(e))
         except Exception as e:
             raise NonRecoverableError('{}: {}\nStack trace: {}'
                                       .format(type(e).__name__, e,
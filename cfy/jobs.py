@@ -0,0 +1,172 @@
+# coding=UTF-8
+
+"""Provides a service watching many jobs from a single thread."""
+
+from __future__ import print_function
+from cfy import (prepare_list_resource, JobFailed, JobCancelled, JobTimedout)
+from resttypes import cobjects, enums
+from concurrent.futures import Future
+import threading
+import time
+import warnings
+
+
+RT = enums.ResourceType
+R = cobjects.Resource
+
+# Seconds between refreshes of the pending jobs, and the maximum number of
+# jobs refreshed with a single request
+WATCH_INTERVAL = 3
+WATCH_BATCH = 100
+# Consecutive failed refreshes after which the pending jobs fail
+WATCH_MAX_FAILURES = 10
+
+
+class JobWatcher(object):
+
+    """Watch jobs, resolving a future for each job once it has finished.
+
+    All pending jobs are refreshed together from a single thread, listing
+    them with one request filtering on all their UUIDs, so the cost of
+    polling stays constant however many jobs are pending. The thread is
+    started when the first job is watched.
+
+    A failed refresh is reported as a warning and retried on the next one,
+    the jobs staying pending until their deadlines pass. Only after
+    `max_failures` consecutive failed refreshes do all pending jobs fail,
+    with the error of the last one.
+    """
+
+    def __init__(self, fco_api, interval=WATCH_INTERVAL, batch=WATCH_BATCH,
+                 max_failures=WATCH_MAX_FAILURES):
+        """
+        Initialise the watcher.
+
+        :param fco_api: FCO API object
+        :param interval: Time in seconds between refreshes
+        :param batch: Maximum number of jobs refreshed with a single request
+        :param max_failures: Consecutive failed refreshes after which pending
+            jobs fail, or None to only fail them at their deadlines
+        """
+        self.fco_api = fco_api
+        self.interval = interval
+        self.batch = batch
+        self.max_failures = max_failures
+        self._failures = 0
+        self._pending = {}
+        self._lock = threading.Condition()
+        self._thread = None
+        self._closed = False
+
+    def watch(self, job, timeout=None):
+        """
+        Watch a job.
+
+        :param job: Job or Job-compatible object
+        :param timeout: Time in seconds after which the job times out
+            (optional)
+        :return: Future resolving to the finished Job-compatible object, or
+            raising `JobFailed`, `JobCancelled` or `JobTimedout`
+        """
+        future = Future()
+        if self._resolve(future, job):
+            return future
+        deadline = None if timeout is None else time.time() + timeout
+        with self._lock:
+            if self._closed:
+                raise RuntimeError('Job watcher is closed')
+            self._pending[job.resourceUUID] = future, deadline
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name='JobWatcher')
+                self._thread.daemon = True
+                self._thread.start()
+        return future
+
+    def close(self):
+        """Stop watching, cancelling the futures of pending jobs."""
+        with self._lock:
+            self._closed = True
+            for future, _ in self._pending.values():
+                future.cancel()
+            self._pending = {}
+            self._lock.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @staticmethod
+    def _resolve(future, job):
+        """Resolve the future of a job if it has finished."""
+        status = enums.JobStatus(job.status)
+        if status == enums.JobStatus.SUCCESSFUL:
+            future.set_result(job)
+        elif status == enums.JobStatus.FAILED:
+            future.set_exception(JobFailed(job.resourceUUID))
+        elif status == enums.JobStatus.CANCELLED:
+            future.set_exception(JobCancelled(job.resourceUUID))
+        else:
+            return False
+        return True
+
+    def _refresh(self, uuids):
+        """List jobs, in batches."""
+        jobs = []
+        for i in range(0, len(uuids), self.batch):
+            batch = uuids[i:i + self.batch]
+            jobs.extend(prepare_list_resource(
+                self.fco_api, R.resourceUUID == batch, RT.JOB,
+                maxRecords=len(batch))().list)
+        return jobs
+
+    def _run(self):
+        while True:
+            with self._lock:
+                if not self._closed:
+                    self._lock.wait(self.interval)
+                if self._closed:
+                    return
+                uuids = list(self._pending)
+            if not uuids:
+                continue
+
+            try:
+                jobs, error = self._refresh(uuids), None
+                self._failures = 0
+            except Exception as e:
+                jobs, error = [], None
+                self._failures += 1
+                if (self.max_failures is not None and
+                        self._failures >= self.max_failures):
+                    error, self._failures = e, 0
+                else:
+                    warnings.warn('Job refresh failed, retrying: {}'
+                                  .format(e), RuntimeWarning)
+            now = time.time()
+
+            # Futures are only resolved while pending, as closing the watcher
+            # cancels them
+            with self._lock:
+                for job in jobs:
+                    entry = self._pending.get(job.resourceUUID)
+                    if entry is not None and (entry[0].cancelled() or
+                                              self._resolve(entry[0], job)):
+                        del self._pending[job.resourceUUID]
+                for uuid in uuids:
+                    if uuid not in self._pending:
+                        continue
+                    future, deadline = self._pending[uuid]
+                    if future.cancelled():
+                        pass
+                    elif error is not None:
+                        future.set_exception(error)
+                    elif deadline is not None and deadline <= now:
+                        future.set_exception(JobTimedout(uuid))
+                    else:
+                        continue
+                    del self._pending[uuid]
@@ -0,0 +1,247 @@
+# coding=UTF-8
+
+"""Provides a pool of pre-generated SSH keys.
+
+Generating a 2048 bit RSA key with pycrypto can take seconds, which SSH key
+creation would otherwise spend before even calling the API. When the
+`FCO_KEY_POOL` environment variable of the workers is set to a directory,
+keys are generated ahead of time into it by a background thread of each
+worker process, started when the process first needs a key, keeping
+`FCO_KEY_POOL_SIZE` keys of each type in use available, and taken from it as
+needed. The pool is shared by all worker processes on the manager, so the
+directory must only be accessible to its owner, and is created so if needed.
+"""
+
+from __future__ import print_function
+from Crypto.PublicKey import RSA
+from glob import glob
+from uuid import uuid4
+import json
+import os
+import shutil
+import stat
+import subprocess
+import tempfile
+import threading
+import warnings
+
+
+ENV_POOL = 'FCO_KEY_POOL'
+ENV_POOL_SIZE = 'FCO_KEY_POOL_SIZE'
+
+KEY_RSA = 'rsa'
+KEY_ECDSA = 'ecdsa'
+KEY_ED25519 = 'ed25519'
+KEY_TYPES = {KEY_RSA, KEY_ECDSA, KEY_ED25519}
+RSA_BITS = 2048
+
+# Number of keys of each type kept available
+POOL_SIZE = 4
+
+
+def generate_key(key_type=KEY_RSA):
+    """
+    Generate an SSH key.
+
+    RSA keys are generated with pycrypto, other key types, which are faster
+    to generate, with `ssh-keygen`.
+
+    :param key_type: Key type, one of `KEY_TYPES`
+    :return: (private key, public key) tuple, the private key in PEM or
+        OpenSSH format and the public key as a line from authorized_keys
+    """
+    if key_type not in KEY_TYPES:
+        raise ValueError('Unsupported key type: {}'.format(key_type))
+    if key_type == KEY_RSA:
+        key = RSA.generate(RSA_BITS)
+        return key.exportKey(), key.publickey().exportKey('OpenSSH')
+
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, 'key')
+        subprocess.check_call(['ssh-keygen', '-q', '-t', key_type, '-N', '',
+                               '-C', '', '-f', path])
+        with open(path) as f:
+            private_key = f.read()
+        with open(path + '.pub') as f:
+            public_key = f.read().strip()
+        return private_key, public_key
+    finally:
+        shutil.rmtree(tmp)
+
+
+def read_public_key(path):
+    """
+    Get the public key of a private key file.
+
+    :param path: Path of the private key
+    :return: Public key as a line from authorized_keys
+    """
+    with open(path) as f:
+        data = f.read()
+    try:
+        return RSA.importKey(data).publickey().exportKey('OpenSSH')
+    except (ValueError, IndexError, TypeError):
+        # Not an RSA key pycrypto can read
+        return subprocess.check_output(['ssh-keygen', '-y', '-f',
+                                        path]).strip()
+
+
+class KeyPool(object):
+
+    """Directory of pre-generated SSH keys, refilled in the background.
+
+    Each key is stored in its own file, written under a temporary name and
+    renamed once complete. Keys are taken by renaming their file, which only
+    one process can do, so the pool can be shared by processes as well as by
+    threads. Concurrent refills may overfill the pool slightly.
+    """
+
+    def __init__(self, path, size=POOL_SIZE, generate=generate_key):
+        """
+        Initialise the pool, creating its directory if needed.
+
+        An existing directory must be owned by the current user and not be
+        accessible to anyone else, as the pool would otherwise hand out keys
+        others can read or have planted.
+
+        :param path: path of the directory
+        :param size: number of keys of each type kept available
+        :param generate: function generating a key of a given type, with the
+            signature of `generate_key`
+        """
+        self.path = path
+        self.size = size
+        self.generate = generate
+        self._threads = {}
+        self._lock = threading.Lock()
+        if not os.path.isdir(path):
+            os.makedirs(path, 0700)
+            # Regardless of the umask
+            os.chmod(path, 0700)
+        st = os.stat(path)
+        if st.st_uid != os.getuid():
+            raise ValueError('Key pool directory {} is not owned by the '
+                             'current user'.format(path))
+        if stat.S_IMODE(st.st_mode) & 0077:
+            raise ValueError('Key pool directory {} is accessible to other '
+                             'users'.format(path))
+
+    def _keys(self, key_type):
+        return glob(os.path.join(self.path, '{}-*.key'.format(key_type)))
+
+    def take(self, key_type=KEY_RSA):
+        """
+        Take a key, refilling the pool in the background.
+
+        :param key_type: Key type, one of `KEY_TYPES`
+        :return: (private key, public key) tuple, or None if the pool has no
+            usable keys of the type available
+        """
+        try:
+            for path in self._keys(key_type):
+                taken = path + '.taken'
+                try:
+                    os.rename(path, taken)
+                except OSError:
+                    # Taken by another process
+                    continue
+                try:
+                    with open(taken) as f:
+                        key = json.load(f)
+                    return key['private'], key['public']
+                except (ValueError, KeyError, TypeError) as e:
+                    # Dropped, as the pool is refilled anyway
+                    warnings.warn('Corrupt key {} dropped: {}'.format(path, e),
+                                  RuntimeWarning)
+                finally:
+                    os.remove(taken)
+            return None
+        finally:
+            self.refill(key_type)
+
+    def put(self, key_type, private_key, public_key):
+        """
+        Add a key.
+
+        :param key_type: Key type
+        :param private_key: Private key
+        :param public_key: Public key
+        """
+        path = os.path.join(self.path, '{}-{}.key'.format(key_type,
+                                                          uuid4().hex))
+        fd = os.open(path + '.tmp', os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+                     0600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump({'private': private_key, 'public': public_key}, f)
+        os.rename(path + '.tmp', path)
+
+    def refill(self, key_type=KEY_RSA):
+        """
+        Generate keys in a background thread until the pool is full, unless
+        already doing so.
+
+        :param key_type: Key type, one of `KEY_TYPES`
+        """
+        with self._lock:
+            thread = self._threads.get(key_type)
+            if thread is not None and thread.is_alive():
+                return
+            thread = threading.Thread(target=self._refill, args=(key_type,),
+                                      name='KeyPool-' + key_type)
+            thread.daemon = True
+            self._threads[key_type] = thread
+            thread.start()
+
+    def _refill(self, key_type):
+        try:
+            while len(self._keys(key_type)) < self.size:
+                self.put(key_type, *self.generate(key_type))
+        except Exception as e:
+            warnings.warn('Key pool refill failed: {}'.format(e),
+                          RuntimeWarning)
+
+
+def default_pool():
+    """Get the pool configured by the environment, if any."""
+    path = os.environ.get(ENV_POOL)
+    if not path:
+        return None
+    try:
+        pool = KeyPool(path, int(os.environ.get(ENV_POOL_SIZE, POOL_SIZE)))
+    except (OSError, ValueError) as e:
+        warnings.warn('Key pool {} unavailable: {}'.format(path, e),
+                      RuntimeWarning)
+        return None
+    pool.refill(KEY_RSA)
+    return pool
+
+
+_pool = None
+_pool_created = False
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Get the pool configured by the environment, creating it if needed."""
+    global _pool, _pool_created
+    with _pool_lock:
+        if not _pool_created:
+            _pool, _pool_created = default_pool(), True
+        return _pool
+
+
+def new_key(key_type=KEY_RSA):
+    """
+    Get a new SSH key, from the pool if there is one with keys available.
+
+    :param key_type: Key type, one of `KEY_TYPES`
+    :return: (private key, public key) tuple
+    """
+    if key_type not in KEY_TYPES:
+        raise ValueError('Unsupported key type: {}'.format(key_type))
+    pool = get_pool()
+    key = pool.take(key_type) if pool is not None else None
+    if key is None:
+        key = generate_key(key_type)
+    return key
@@ -0,0 +1,127 @@
+# coding=UTF-8
+
+"""Provides polling scheduled by the expected latency of transitions.
+
+Waiting for a resource to change, e.g. for a server to become active, checks
+immediately and then backs off exponentially. The durations of transitions
+are recorded, and once a transition has been observed the first check after
+the immediate one is delayed until shortly before its expected duration,
+backing off from a fraction of it, concentrating the checks around the time
+the transition is likely to complete.
+"""
+
+from collections import (defaultdict, deque)
+import threading
+import time
+
+
+# Seconds to first wait between checks, and factor to multiply the wait by
+POLL_DELAY = 0.5
+POLL_BACKOFF = 2
+
+# Fraction of the expected duration of a transition to first check at, and
+# the minimum wait in seconds between checks after it
+POLL_LEAD = 0.9
+POLL_MIN_DELAY = 0.1
+
+# Number of most recent durations kept per transition
+LATENCY_HISTORY = 10
+
+
+class LatencyModel(object):
+
+    """Thread-safe record of recent transition durations."""
+
+    def __init__(self, history=LATENCY_HISTORY):
+        """
+        Initialise the model.
+
+        :param history: number of most recent durations kept per transition
+        """
+        self._durations = defaultdict(lambda: deque(maxlen=history))
+        self._lock = threading.Lock()
+
+    def observe(self, transition, duration):
+        """
+        Record the duration of a transition.
+
+        :param transition: hashable transition key
+        :param duration: duration in seconds
+        """
+        with self._lock:
+            self._durations[transition].append(duration)
+
+    def expected(self, transition):
+        """
+        Get the expected duration of a transition.
+
+        :param transition: hashable transition key
+        :return: lower quartile of the recent durations in seconds, or None
+            if the transition has not been observed
+        """
+        with self._lock:
+            durations = sorted(self._durations.get(transition, ()))
+        if not durations:
+            return None
+        # Rather early than late, so the model catches up quickly with
+        # transitions becoming faster
+        return durations[len(durations) // 4]
+
+
+latency_model = LatencyModel()
+
+
+def poll(check, timeout, transition=None, maximum=None, delay=POLL_DELAY,
+         backoff=POLL_BACKOFF, model=latency_model, clock=time.time,
+         sleep=time.sleep):
+    """
+    Check until the check succeeds or the timeout passes.
+
+    Checks immediately, then waits until shortly before the expected duration
+    of the transition if known, and then backs off exponentially. Durations
+    are recorded as the time the transition was first seen completed, unless
+    it already was by the immediate check, which says nothing about how long
+    the transition took.
+
+    :param check: function returning a true value once done
+    :param timeout: time in seconds after which no more checks are made
+    :param transition: hashable transition key, durations are recorded and
+        used to schedule checks if set (optional)
+    :param maximum: maximum time in seconds between checks when backing off
+        (optional)
+    :param delay: time in seconds to first wait between checks, unless the
+        expected duration of the transition is known
+    :param backoff: factor to multiply the time between checks by
+    :param model: latency model
+    :param clock: function returning the current time
+    :param sleep: function sleeping for a given time
+    :return: value of the last check
+    """
+    start = clock()
+    deadline = start + timeout
+    expected = model.expected(transition) if transition is not None else None
+    if expected is not None:
+        delay = max(expected * (1 - POLL_LEAD), POLL_MIN_DELAY)
+        expected *= POLL_LEAD
+
+    waited = False
+    while True:
+        result = check()
+        now = clock()
+        if result:
+            if transition is not None and waited:
+                model.observe(transition, now - start)
+            return result
+        if now >= deadline:
+            return result
+
+        if expected is not None and now - start < expected:
+            wait = expected - (now - start)
+        else:
+            wait = delay
+            delay *= backoff
+            if maximum is not None:
+                wait, delay = min(wait, maximum), min(delay, maximum)
+        expected = None
+        sleep(min(wait, deadline - now))
+        waited = True
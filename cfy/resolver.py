@@ -0,0 +1,323 @@
+# coding=UTF-8
+
+"""Provides a cache of resources resolved by name or UUID.
+
+Every server resolves its configuration, e.g. its image, VDC and product
+offers, from the same catalogue resources as every other instance of every
+deployment. Resolved resources are kept in an in-process LRU cache and,
+optionally, in an SQLite database shared by all worker processes on the
+manager, set by the `FCO_RESOLVER_STORE` environment variable. Entries expire
+after a TTL depending on the resource type and are discarded whenever a
+lookup raises a `NoResourceError`.
+"""
+
+from __future__ import print_function
+from cfy import (get_resource, NoResourceError)
+from resttypes import cobjects, enums
+from collections import OrderedDict
+from time import time
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import warnings
+
+
+RT = enums.ResourceType
+
+ENV_STORE = 'FCO_RESOLVER_STORE'
+
+# Seconds resolved resources are cached for by resource type, resources of
+# any other type, e.g. servers and jobs, change too often to be cached
+RESOURCE_TTLS = {
+    RT.IMAGE: 600,
+    RT.VDC: 3600,
+    RT.NETWORK: 3600,
+    RT.PRODUCTOFFER: 3600,
+    RT.SSHKEY: 600,
+}
+LRU_SIZE = 256
+STORE_TIMEOUT = 5
+# Version of the store schema, stores of other versions are recreated
+STORE_VERSION = 1
+
+
+class LRUCache(object):
+
+    """Thread-safe LRU cache of entries expiring at given times."""
+
+    def __init__(self, size=LRU_SIZE):
+        """
+        Initialise the cache.
+
+        :param size: maximum number of entries
+        """
+        self.size = size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, now):
+        """
+        Get an entry that has not expired.
+
+        :param key: entry key
+        :param now: current time
+        :return: (value, expiry time) tuple, or None if there is no entry
+        """
+        with self._lock:
+            try:
+                entry = self._entries.pop(key)
+            except KeyError:
+                return None
+            if entry[1] <= now:
+                return None
+            self._entries[key] = entry
+            return entry
+
+    def put(self, key, value, expires):
+        """
+        Add an entry, evicting the least recently used entry if full.
+
+        :param key: entry key
+        :param value: entry value
+        :param expires: entry expiry time
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = value, expires
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """Remove an entry if it exists."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SQLiteStore(object):
+
+    """Resolved resources stored in an SQLite database.
+
+    Every operation uses its own connection, so the store can be shared by
+    threads as well as by processes.
+    """
+
+    def __init__(self, path, timeout=STORE_TIMEOUT):
+        """
+        Initialise the store, creating the database if needed.
+
+        :param path: path of the database
+        :param timeout: seconds to wait for other processes to unlock the
+            database
+        """
+        self.path = path
+        self.timeout = timeout
+        db = sqlite3.connect(path, timeout=timeout)
+        try:
+            with db:
+                version, = db.execute('PRAGMA user_version').fetchone()
+                if version != STORE_VERSION:
+                    # Entries are only cached, so older ones are dropped
+                    db.execute('DROP TABLE IF EXISTS resources')
+                    db.execute('PRAGMA user_version = {:d}'
+                               .format(STORE_VERSION))
+                db.execute('CREATE TABLE IF NOT EXISTS resources ('
+                           'key TEXT PRIMARY KEY, type TEXT NOT NULL, '
+                           'data TEXT NOT NULL, expires REAL NOT NULL)')
+        finally:
+            db.close()
+
+    def _execute(self, sql, *args):
+        db = sqlite3.connect(self.path, timeout=self.timeout)
+        try:
+            with db:
+                return db.execute(sql, args).fetchall()
+        finally:
+            db.close()
+
+    def get(self, key, now):
+        """
+        Get a resource that has not expired.
+
+        :param key: entry key
+        :param now: current time
+        :return: (resource, expiry time) tuple, or None if there is no entry
+            or it cannot be rebuilt
+        """
+        rows = self._execute('SELECT type, data, expires FROM resources '
+                             'WHERE key = ? AND expires > ?', key, now)
+        if not rows:
+            return None
+        type_, data, expires = rows[0]
+        # Rebuild the type the API returned, as the in-process cache would
+        cls = getattr(cobjects, str(type_), cobjects.GenericContainer)
+        try:
+            return cls(json.loads(data)), expires
+        except Exception as e:
+            # Corrupt or stale entries are dropped, costing an API call
+            self.discard(key)
+            warnings.warn('Resolver store entry dropped: {}'.format(e),
+                          RuntimeWarning)
+            return None
+
+    def put(self, key, resource, expires):
+        """
+        Store a resource.
+
+        :param key: entry key
+        :param resource: resource
+        :param expires: entry expiry time
+        """
+        self._execute('INSERT OR REPLACE INTO resources '
+                      '(key, type, data, expires) VALUES (?, ?, ?, ?)', key,
+                      type(resource).__name__, json.dumps(resource.untype()),
+                      expires)
+
+    def discard(self, key):
+        """Remove a resource if it exists."""
+        self._execute('DELETE FROM resources WHERE key = ?', key)
+
+    def clear(self):
+        """Remove all resources."""
+        self._execute('DELETE FROM resources')
+
+
+class Resolver(object):
+
+    """Two-tier cache of resources resolved by name or UUID.
+
+    Looks resources up in the in-process LRU cache first, then in the shared
+    store if there is one, and only then using the API. Errors of the shared
+    store are reported as warnings and otherwise ignored, so an unavailable
+    store only costs API calls.
+    """
+
+    def __init__(self, store=None, ttls=None, size=LRU_SIZE, timer=time):
+        """
+        Initialise the resolver.
+
+        :param store: shared store, e.g. `SQLiteStore` (optional)
+        :param ttls: resource type to TTL mapping, defaults to `RESOURCE_TTLS`
+        :param size: maximum number of resources cached in-process
+        :param timer: function returning the current time
+        """
+        self.cache = LRUCache(size)
+        self.store = store
+        self.ttls = RESOURCE_TTLS if ttls is None else ttls
+        self.timer = timer
+
+    @staticmethod
+    def key(fco_api, res_id, res_type, res_state):
+        """
+        Get the cache key of a lookup.
+
+        Lookups are scoped to the API URL and the account or token used, as
+        resources are only visible to some customers and names need not be
+        unique across them.
+
+        :param fco_api: FCO API object
+        :param res_id: Resource name or UUID
+        :param res_type: Resource type
+        :param res_state: Resource state
+        :return: cache key
+        """
+        client = fco_api.client
+        scope = hashlib.sha1(u'{}\n{}'.format(client.service_url,
+                                              client.auth[0])
+                             .encode('utf-8')).hexdigest()
+        return json.dumps([scope, str(res_type), res_id, str(res_state)])
+
+    def _ttl(self, res_type):
+        if res_type is None:
+            return None
+        try:
+            return self.ttls.get(RT(res_type))
+        except ValueError:
+            return None
+
+    def _store(self, method, *args):
+        if self.store is None:
+            return None
+        try:
+            return getattr(self.store, method)(*args)
+        except sqlite3.Error as e:
+            warnings.warn('Resolver store {} failed: {}'.format(method, e),
+                          RuntimeWarning)
+            return None
+
+    def get_resource(self, fco_api, res_id, res_type,
+                     res_state=enums.ResourceState.ACTIVE):
+        """
+        Get a resource by name or UUID, see `cfy.get_resource`.
+
+        :param fco_api: FCO API object
+        :param res_id: Resource name or UUID
+        :param res_type: Resource type
+        :param res_state: Resource state
+        :return: Resource type-compatible object
+        """
+        ttl = self._ttl(res_type)
+        if not ttl:
+            return get_resource(fco_api, res_id, res_type, res_state)
+
+        key = self.key(fco_api, res_id, res_type, res_state)
+        now = self.timer()
+        entry = self.cache.get(key, now)
+        if entry is None:
+            entry = self._store('get', key, now)
+            if entry is not None:
+                self.cache.put(key, *entry)
+        if entry is not None:
+            return entry[0]
+
+        try:
+            resource = get_resource(fco_api, res_id, res_type, res_state)
+        except NoResourceError:
+            self._invalidate(key)
+            raise
+        self.cache.put(key, resource, now + ttl)
+        self._store('put', key, resource, now + ttl)
+        return resource
+
+    def invalidate(self, fco_api, res_id, res_type,
+                   res_state=enums.ResourceState.ACTIVE):
+        """
+        Discard a cached lookup, e.g. after its resource was found missing.
+
+        :param fco_api: FCO API object
+        :param res_id: Resource name or UUID
+        :param res_type: Resource type
+        :param res_state: Resource state
+        """
+        self._invalidate(self.key(fco_api, res_id, res_type, res_state))
+
+    def _invalidate(self, key):
+        self.cache.discard(key)
+        self._store('discard', key)
+
+    def clear(self):
+        """Discard all cached lookups."""
+        self.cache.clear()
+        self._store('clear')
+
+
+def default_store():
+    """Get the shared store configured by the environment, if any."""
+    path = os.environ.get(ENV_STORE)
+    if not path:
+        return None
+    try:
+        return SQLiteStore(path)
+    except sqlite3.Error as e:
+        warnings.warn('Resolver store {} unavailable: {}'.format(path, e),
+                      RuntimeWarning)
+        return None
+
+
+resolver = Resolver(default_store())
@@ -3,12 +3,14 @@
 """Server stuff."""
 
 from __future__ import print_function
-from cfy import (create_server,
-                 create_ssh_key,
+from cfy import (call_concurrently,
+                 create_server,
+                 create_ssh_keys,
                  attach_ssh_key,
                  wait_for_state,
                  wait_for_cond,
                  create_nic,
+                 nic_skeleton,
                  attach_nic,
                  get_resource,
                  get_server_status,
@@ -16,19 +18,18 @@ from cfy import (create_server,
                  stop_server,
                  delete_resource)
 import socket
-import errno
 from cloudify import ctx
 from cloudify.decorators import operation
 from cloudify.exceptions import NonRecoverableError
 from cfy.helpers import (with_fco_api, with_exceptions_handled)
+from cfy.jobs import JobWatcher
+from cfy.polling import poll
+from cfy.resolver import resolver
 from resttypes import enums, cobjects
-from paramiko import SSHClient, AutoAddPolicy
-import spur
-import spur.ssh
+from paramiko import (SSHClient, SSHException, AutoAddPolicy)
 from time import sleep
-from subprocess import call
-from fabric.api import settings, run
 import os
+import posixpath
 
 
 RT = enums.ResourceType
@@ -49,10 +50,108 @@ RPROP_UUID = 'uuid'
 RPROP_DISKS = 'disks'
 RPROP_NIC = 'nic'
 RPROP_NICS = 'nics'
+RPROP_KEYS = 'keys'
 RPROP_IP = 'ip'
 RPROP_USER = 'username'
 RPROP_PASS = 'password'
 
+SSH_PORT = 22
+# Seconds to wait for the server to accept SSH connections, the maximum
+# time between checks and the timeout of each check
+SSH_TIMEOUT = 300
+SSH_MAX_DELAY = 10
+SSH_PROBE_TIMEOUT = 3
+# Attempts to open an SSH session once the port is open, as the SSH daemon
+# may not accept logins yet, and seconds between them
+SSH_ATTEMPTS = 5
+SSH_RETRY_DELAY = 2
+
+
+def port_open(host, port, timeout=SSH_PROBE_TIMEOUT):
+    """
+    Check whether a host accepts TCP connections on a port.
+
+    :param host: Host name or IP address
+    :param port: Port
+    :param timeout: Time in seconds to wait for the connection
+    :return: True if the connection was accepted, False otherwise
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    try:
+        return sock.connect_ex((host, port)) == 0
+    except socket.error:
+        return False
+    finally:
+        sock.close()
+
+
+def ssh_connect(host, username, password, port=SSH_PORT,
+                attempts=SSH_ATTEMPTS, delay=SSH_RETRY_DELAY):
+    """
+    Open an SSH session, retrying while the SSH daemon is starting.
+
+    :param host: Host name or IP address
+    :param username: Username
+    :param password: Password
+    :param port: Port
+    :param attempts: Number of attempts
+    :param delay: Time in seconds between attempts
+    :return: Connected `SSHClient`
+    """
+    ssh = SSHClient()
+    ssh.set_missing_host_key_policy(AutoAddPolicy())
+    while True:
+        attempts -= 1
+        try:
+            ssh.connect(host, port, username, password,
+                        timeout=SSH_PROBE_TIMEOUT, allow_agent=False,
+                        look_for_keys=False)
+            return ssh
+        except (SSHException, socket.error):
+            if not attempts:
+                raise
+        sleep(delay)
+
+
+def provision_keys(host, username, password, key_contents):
+    """
+    Upload private keys to ~/.ssh over a single SSH session.
+
+    The keys are uploaded with one SFTP session, each made private before
+    its content is written, and the permissions of ~/.ssh set with one
+    remote command.
+
+    :param host: Host name or IP address
+    :param username: Username
+    :param password: Password
+    :param key_contents: Local key path to key content mapping
+    """
+    ssh = ssh_connect(host, username, password)
+    try:
+        sftp = ssh.open_sftp()
+        try:
+            # SFTP paths are relative to the home directory
+            try:
+                sftp.mkdir('.ssh', 0700)
+            except IOError:
+                pass
+            for key, key_content in key_contents.items():
+                remote = posixpath.join('.ssh', os.path.basename(key))
+                # Never readable by others, whatever the remote umask
+                with sftp.open(remote, 'w') as f:
+                    f.chmod(0600)
+                    f.write(key_content)
+        finally:
+            sftp.close()
+
+        _, stdout, stderr = ssh.exec_command('chmod 0700 .ssh')
+        if stdout.channel.recv_exit_status():
+            raise Exception('Setting .ssh permissions failed: {}'
+                            .format(stderr.read()))
+    finally:
+        ssh.close()
+
 
 @operation
 @with_fco_api
@@ -79,15 +178,33 @@ def create(fco_api, *args, **kwargs):
         return (_rp[RPROP_UUID], _rp[RPROP_IP], _rp[RPROP_USER],
                 _rp[RPROP_PASS])
 
-    # Get configuration
-    image = get_resource(fco_api, _np[PROP_IMAGE], RT.IMAGE)
+    # Get configuration, the boot disk product offer depends on the image
+    def resolve(res_id, res_type):
+        return lambda: resolver.get_resource(fco_api, res_id, res_type)
+
+    image_id = _np[PROP_IMAGE]
+
+    def resolve_image():
+        image = resolver.get_resource(fco_api, image_id, RT.IMAGE)
+        # TODO: better way of determining suitable disk
+        boot_disk_po = resolver.get_resource(
+            fco_api, '{} GB Storage Disk'.format(image.size), RT.PRODUCTOFFER)
+        return image, boot_disk_po
+
+    lookups = {PROP_NET: RT.NETWORK, PROP_SERVER_PO: RT.PRODUCTOFFER,
+               PROP_MANAGER_KEY: RT.SSHKEY}
     if _np[PROP_IMAGE]:
-        vdc = get_resource(fco_api, _np[PROP_VDC], RT.VDC)
-    else:
-        vdc = None
-    network = get_resource(fco_api, _np[PROP_NET], RT.NETWORK)
-    server_po = get_resource(fco_api, _np[PROP_SERVER_PO], RT.PRODUCTOFFER)
-    manager_key = get_resource(fco_api, _np[PROP_MANAGER_KEY], RT.SSHKEY)
+        lookups[PROP_VDC] = RT.VDC
+    calls = {prop: resolve(_np[prop], res_type)
+             for prop, res_type in lookups.items()}
+    calls[PROP_IMAGE] = resolve_image
+    config = call_concurrently(calls)
+
+    image, boot_disk_po = config[PROP_IMAGE]
+    vdc = config.get(PROP_VDC)
+    network = config[PROP_NET]
+    server_po = config[PROP_SERVER_PO]
+    manager_key = config[PROP_MANAGER_KEY]
     cpu_count = _np[PROP_CPU_COUNT]
     ram_amount = _np[PROP_RAM_AMOUNT]
     public_keys = _np[PROP_PUBLIC_KEYS] or []
@@ -123,10 +240,7 @@ def create(fco_api, *args, **kwargs):
     network_type = network.networkType
     server_po_uuid = server_po.resourceUUID
     manager_key_uuid = manager_key.resourceUUID
-    # TODO: better way of determining suitable disk
-    boot_disk_po_uuid = get_resource(fco_api,
-                                     '{} GB Storage Disk'.format(image.size),
-                                     RT.PRODUCTOFFER).resourceUUID
+    boot_disk_po_uuid = boot_disk_po.resourceUUID
 
     ctx.logger.info('Configuration: \n'
                     'image_uuid: %s\n'
@@ -139,9 +253,24 @@ def create(fco_api, *args, **kwargs):
                     image_uuid, cluster_uuid, vdc_uuid, network_uuid,
                     server_po_uuid, manager_key_uuid, boot_disk_po_uuid)
 
-    # Create server
     server_name = '{}{}_{}'.format(ctx.bootstrap_context.resources_prefix,
                                    ctx.deployment.id, ctx.instance.id)
+
+    # Create keys concurrently, waiting for their jobs together, and keep
+    # track of them so they are not created again if the operation is retried
+    keys = dict(_rp.get(RPROP_KEYS, {}))
+    missing_keys = [key for key in public_keys if key not in keys]
+    if missing_keys:
+        with JobWatcher(fco_api) as job_watcher:
+            keys.update(zip(missing_keys, create_ssh_keys(
+                fco_api, missing_keys, server_name + ' Key',
+                job_watcher=job_watcher)))
+        _rp[RPROP_KEYS] = keys
+    key_uuids = [keys[key] for key in public_keys]
+
+    ctx.logger.info('Keys created: %s', key_uuids)
+
+    # Create server, attaching the keys
     try:
         server_uuid = _rp[RPROP_UUID]
     except KeyError:
@@ -154,10 +283,25 @@ def create(fco_api, *args, **kwargs):
         #         submit_key[k] = getattr(manager_key, k)
         #     except AttributeError:
         #         submit_key[k] = None
-        server_uuid = create_server(fco_api, server_po_uuid, image_uuid,
-                                    cluster_uuid, vdc_uuid, cpu_count,
-                                    ram_amount, boot_disk_po_uuid,
-                                    [manager_key], server_name)
+        # Create the NIC with the server, so it need not be attached later
+        nic_skel = nic_skeleton(cluster_uuid, network_type, network_uuid,
+                                vdc_uuid, server_name + ' NIC')
+        try:
+            server_uuid = create_server(fco_api, server_po_uuid, image_uuid,
+                                        cluster_uuid, vdc_uuid, cpu_count,
+                                        ram_amount, boot_disk_po_uuid,
+                                        [manager_key] + key_uuids,
+                                        server_name,
+                                        disk_size=image.size,
+                                        nic_skeletons=[nic_skel])
+        except Exception:
+            # The configuration may have been resolved from stale entries
+            for prop, res_type in lookups.items():
+                resolver.invalidate(fco_api, _np[prop], res_type)
+            resolver.invalidate(fco_api, image_id, RT.IMAGE)
+            resolver.invalidate(fco_api, '{} GB Storage Disk'.format(
+                image.size), RT.PRODUCTOFFER)
+            raise
         _rp[RPROP_UUID] = server_uuid
 
     ctx.logger.info('server_uuid: %s', server_uuid)
@@ -173,41 +317,44 @@ def create(fco_api, *args, **kwargs):
 
     ctx.logger.info('Server ACTIVE')
 
-    # Add keys
-    new_keys = set()
-    for key in public_keys:
-        if key not in server_keys:
-            key_uuid = create_ssh_key(fco_api, key, server_name + ' Key')
-            attach_ssh_key(fco_api, server_uuid, key_uuid)
-            new_keys.add(key_uuid)
+    # Attach keys, unless attached by creating the server
+    new_keys = [key_uuid for key_uuid in key_uuids
+                if key_uuid not in server_keys]
+    call_concurrently({key_uuid: (lambda key_uuid=key_uuid: attach_ssh_key(
+        fco_api, server_uuid, key_uuid)) for key_uuid in new_keys})
 
     ctx.logger.info('Keys attached: %s', new_keys)
 
-    # Create NIC
+    # Create NIC, unless created with the server
     try:
         nic_uuid = _rp[RPROP_NIC]
     except KeyError:
-        nic_uuid = create_nic(fco_api, cluster_uuid, network_type,
-                              network_uuid, vdc_uuid, server_name + ' NIC')
-        if not wait_for_state(fco_api, nic_uuid, enums.ResourceState.ACTIVE,
-                              RT.NIC):
-            raise Exception('NIC failed to create in time!')
+        if server_nics:
+            nic_uuid = server_nics[0]
+        else:
+            nic_uuid = create_nic(fco_api, cluster_uuid, network_type,
+                                  network_uuid, vdc_uuid,
+                                  server_name + ' NIC')
+            if not wait_for_state(fco_api, nic_uuid,
+                                  enums.ResourceState.ACTIVE, RT.NIC):
+                raise Exception('NIC failed to create in time!')
         _rp[RPROP_NIC] = nic_uuid
 
     ctx.logger.info('nic_uuid: %s', nic_uuid)
 
-    # Stop server if started
-    if get_server_status(fco_api, server_uuid) != enums.ServerStatus.STOPPED:
-        if not stop_server(fco_api, server_uuid):
-            raise Exception('Stopping server failed to complete in time!')
-
-    ctx.logger.info('Server STOPPED')
-
-    # Attach NIC
+    # Attach NIC, stopping the server if started
     if nic_uuid not in server_nics:
+        if get_server_status(fco_api, server_uuid) != \
+                enums.ServerStatus.STOPPED:
+            if not stop_server(fco_api, server_uuid):
+                raise Exception('Stopping server failed to complete in '
+                                'time!')
+        ctx.logger.info('Server STOPPED')
+
         job_uuid = attach_nic(fco_api, server_uuid, nic_uuid, 1).resourceUUID
         cond = cobjects.Job.status == enums.JobStatus.SUCCESSFUL
-        if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB):
+        if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB,
+                             transition='ATTACH_NIC'):
             raise Exception('Attaching NIC failed to complete in time!')
         ctx.logger.info('NICs attached')
     else:
@@ -222,99 +369,21 @@ def create(fco_api, *args, **kwargs):
 
     nic = get_resource(fco_api, nic_uuid, RT.NIC)
     server_ip = nic.ipAddresses[0].ipAddress
-    server_port = 22
 
     ctx.logger.info('Server READY')
 
     username = server.initialUser
     password = server.initialPassword
 
-    ssh_attempts = -1
-    ssh_delay = 3
-
-    # Fabric test
-
-    while ssh_attempts:
-        ctx.logger.info('Attempting to SSH ({})'.format(ssh_attempts))
-        try:
-            with settings(host_string=server_po_uuid, user=username,
-                          password=password, disable_known_hosts=True,
-                          abort_exception=Exception):
-                run('mkdir ~/.ssh')
-                run('chmod 0700 ~/.ssh')
-                for key, key_content in key_contents.items():
-                    remote = os.path.join('~', '.ssh', os.path.basename(key))
-                    run('echo \'{}\' > {}'.format(key_content, remote))
-                    run('chmod 0600 ' + remote)
-                ctx.logger.info('Done')
-                break
-        except Exception as e:
-            ctx.logger.info(e)
-        ssh_attempts -= 1
-    else:
-        raise Exception('Failed to provision keys in time')
-
-    # # Spur test
-    # while ssh_attempts:
-    #     ctx.logger.info('Attempting to SSH ({})'.format(ssh_attempts))
-    #     shell = spur.SshShell(
-    #         hostname=server_ip,
-    #         port=server_port,
-    #         username=username,
-    #         password=password,
-    #         shell_type=spur.ssh.ShellTypes.minimal,
-    #         missing_host_key=spur.ssh.MissingHostKey.accept
-    #     )
-    #     with shell:
-    #         try:
-    #             ctx.logger.info('Creating & chmoding .ssh')
-    #             shell.run(['mkdir', '~/.ssh'])
-    #             shell.run(['chmod', '0700', '~/.ssh'])
-    #             for key, key_content in key_contents.items():
-    #                 ctx.logger.info('Adding private key: ' + remote)
-    #                 remote = os.path.join('~', '.ssh', os.path.basename(key))
-    #                 shell.run(['echo', "'{}'".format(key_content), '>',
-    #                            remote])
-    #                 shell.run(['chmod', '0600', remote])
-    #         except spur.ssh.ConnectionError as e:
-    #             if e.original_error[0] not in {errno.ECONNREFUSED,
-    #                                         errno.EHOSTUNREACH}:
-    #                 raise
-    #             sleep(ssh_delay)
-    #         ssh_attempts -= 1
-    # else:
-    #     raise Exception('Failed to provision keys in time')
-
-    # # Provision private keys
-    # ssh = SSHClient()
-    # call(['ssh-keygen', '-R', server_ip])
-    # ssh.set_missing_host_key_policy(AutoAddPolicy())
-    #
-    # while ssh_attempts:
-    #     try:
-    #         ctx.logger.info('Attempting to SSH ({})'.format(ssh_attempts))
-    #         ctx.logger.info('SSH Connection details: {}'.format(
-    #             ((server_ip, server_port, username, password, ssh_delay))))
-    #         ssh.connect(server_ip, server_port, username, password,
-    #                     timeout=ssh_delay, look_for_keys=False)
-    #         ctx.logger.info('SSH connection established')
-    #         break
-    #     except socket.timeout:
-    #         ssh_attempts -= 1
-    #     except socket.error as e:
-    #         if e[0] not in {errno.ECONNREFUSED, errno.EHOSTUNREACH}:
-    #             ctx.logger.info('SSH connection failed: %s', e[0])
-    #             raise
-    #         sleep(ssh_delay)
-    #     ssh_attempts -= 1
-    # else:
-    #     raise Exception('Failed to provision keys in time')
-    # ssh.exec_command('mkdir ~/.ssh')
-    # ssh.exec_command('chmod 0700 ~/.ssh')
-    # for key, key_content in key_contents.items():
-    #     remote = os.path.join('~', '.ssh', os.path.basename(key))
-    #     ssh.exec_command('echo \'{}\' > {}'.format(key_content, remote))
-    #     ssh.exec_command('chmod 0600 ' + remote)
+    # Provision private keys
+    if key_contents:
+        if not poll(lambda: port_open(server_ip, SSH_PORT), SSH_TIMEOUT,
+                    transition='SSH_READY', maximum=SSH_MAX_DELAY):
+            raise Exception('Server failed to accept SSH connections in '
+                            'time!')
+        ctx.logger.info('Server accepting SSH connections')
+        provision_keys(server_ip, username, password, key_contents)
+        ctx.logger.info('Private keys provisioned: %s', key_contents.keys())
 
     _rp[RPROP_UUID] = server_uuid
     _rp[RPROP_IP] = server_ip
@@ -340,7 +409,8 @@ def delete(fco_api, *args, **kwargs):
     job_uuid = delete_resource(fco_api, server_uuid, RT.SERVER, True) \
         .resourceUUID
     cond = cobjects.Job.status == enums.JobStatus.SUCCESSFUL
-    if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB):
+    if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB,
+                         transition='DELETE_SERVER'):
         raise Exception('Failed to delete server')
 
 
@@ -10,9 +10,9 @@ from cfy import (create_ssh_key,
 from cloudify import ctx
 from cloudify.decorators import operation
 from cfy.helpers import (with_fco_api, with_exceptions_handled)
+from cfy.keypool import (new_key, read_public_key, KEY_RSA)
 from resttypes import enums, cobjects
 import os
-from Crypto.PublicKey import RSA
 
 
 RT = enums.ResourceType
@@ -22,6 +22,7 @@ PROP_USE_EXISTING = 'use_existing'
 PROP_PRIVATE_KEY = 'private_key_path'
 PROP_USER = 'user'
 PROP_GLOBAL = 'global'
+PROP_KEY_TYPE = 'key_type'
 
 RPROP_UUID = 'uuid'
 
@@ -47,17 +48,16 @@ def create(fco_api, *args, **kwargs):
     private_key_exists = os.path.isfile(private_key)
     user = _np[PROP_USER]
     global_ = _np[PROP_GLOBAL]
+    key_type = _np.get(PROP_KEY_TYPE) or KEY_RSA
 
     # Get public key, generate private key if necessary
     if not private_key_exists:
-        key = RSA.generate(2048)
+        private_key_content, public_key = new_key(key_type)
         with open(private_key, 'w') as f:
             os.chmod(private_key, 0600)
-            f.write(key.exportKey())
+            f.write(private_key_content)
     else:
-        with open(private_key, 'r') as f:
-            key = RSA.importKey(f.read())
-    public_key = key.publickey()
+        public_key = read_public_key(private_key)
 
     key_name = '{}{}_{}'.format(ctx.bootstrap_context.resources_prefix,
                                 ctx.deployment.id, ctx.instance.id)
@@ -76,7 +76,8 @@ def delete(fco_api, *args, **kwargs):
     key_uuid = ctx.instance.runtime_properties.get(RPROP_UUID)
     job_uuid = delete_resource(fco_api, key_uuid, RT.SERVER, True).resourceUUID
     cond = cobjects.Job.status == enums.JobStatus.SUCCESSFUL
-    if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB):
+    if not wait_for_cond(fco_api, job_uuid, cond, RT.JOB,
+                         transition='DELETE_SSHKEY'):
         raise Exception('Failed to delete SSH key')
 
 
@@ -0,0 +1,33 @@
+# coding=UTF-8
+
+"""Test case running against the fake FCO control plane."""
+
+import logging
+import unittest
+
+from benchmarks.fakefco import (FakeFCO, FakeFCOServer)
+from fcoclient.api import REST
+
+
+class FakeFCOTestCase(unittest.TestCase):
+
+    """Test case with an API connected to a seeded fake control plane."""
+
+    latency = 0
+    job_time = 0
+
+    def setUp(self):
+        self.server = FakeFCOServer(FakeFCO(latency=self.latency,
+                                            job_time=self.job_time))
+        self.server.__enter__()
+        self.addCleanup(self.server.__exit__)
+        self.fco = self.server.fco
+        self.names = self.fco.seed()
+        self.api = REST({'token': 't', 'url': self.server.url},
+                        logging.getLogger(__name__))
+
+    def requests_made(self, f, *args, **kwargs):
+        """Call a function and count the requests it makes."""
+        before = len(self.fco.requests)
+        result = f(*args, **kwargs)
+        return result, len(self.fco.requests) - before
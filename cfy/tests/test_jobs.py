@@ -0,0 +1,86 @@
+# coding=UTF-8
+
+"""Tests for watching jobs."""
+
+import warnings
+
+from cfy import JobTimedout
+from cfy.jobs import JobWatcher
+from cfy.tests.base import FakeFCOTestCase
+from resttypes import (cobjects, enums)
+
+
+class RefreshError(Exception):
+    pass
+
+
+class JobWatcherTest(FakeFCOTestCase):
+
+    job_time = 0.2
+
+    def setUp(self):
+        super(JobWatcherTest, self).setUp()
+        self.item = self.fco.add('SERVER', 'Server')
+
+    def job(self):
+        return cobjects.GenericContainer(self.fco.job(self.item,
+                                                      'CREATE_SERVER'))
+
+    def watcher(self, failures=0, **kwargs):
+        """Get a watcher whose first refreshes fail."""
+        watcher = JobWatcher(self.api, interval=0.05, **kwargs)
+        self.addCleanup(watcher.close)
+        refresh = watcher._refresh
+        self.refreshes = []
+
+        def _refresh(uuids):
+            self.refreshes.append(uuids)
+            if len(self.refreshes) <= failures:
+                raise RefreshError()
+            return refresh(uuids)
+        watcher._refresh = _refresh
+        return watcher
+
+    def test_resolves_jobs(self):
+        watcher = self.watcher()
+        futures = [watcher.watch(self.job()) for _ in range(3)]
+        for future in futures:
+            self.assertEqual(future.result(2).status,
+                             enums.JobStatus.SUCCESSFUL)
+        self.assertTrue(all(len(uuids) == 3 for uuids in self.refreshes))
+
+    def test_finished_job(self):
+        self.fco.job_time = 0
+        future = self.watcher().watch(self.job())
+        self.assertTrue(future.done())
+        self.assertEqual(self.refreshes, [])
+
+    def test_retries_failed_refreshes(self):
+        watcher = self.watcher(failures=3)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            future = watcher.watch(self.job())
+            self.assertEqual(future.result(2).status,
+                             enums.JobStatus.SUCCESSFUL)
+        self.assertGreater(len(self.refreshes), 3)
+
+    def test_fails_after_consecutive_failures(self):
+        watcher = self.watcher(failures=100, max_failures=3)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            future = watcher.watch(self.job())
+            self.assertIsInstance(future.exception(2), RefreshError)
+        self.assertEqual(len(self.refreshes), 3)
+
+    def test_times_out_while_failing(self):
+        watcher = self.watcher(failures=100, max_failures=None)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            future = watcher.watch(self.job(), timeout=0.2)
+            self.assertIsInstance(future.exception(2), JobTimedout)
+
+    def test_close_cancels(self):
+        watcher = self.watcher()
+        future = watcher.watch(self.job())
+        watcher.close()
+        self.assertTrue(future.cancelled())
@@ -0,0 +1,193 @@
+# coding=UTF-8
+
+"""Tests for the pool of pre-generated SSH keys."""
+
+import os
+import shutil
+import stat
+import tempfile
+import threading
+import unittest
+import warnings
+from itertools import count
+
+from cfy import keypool
+
+
+def mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def pool_threads():
+    return [t for t in threading.enumerate()
+            if t.name.startswith('KeyPool-')]
+
+
+class DefaultPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.path = os.path.join(tmp, 'pool')
+        environ = os.environ.copy()
+        self.addCleanup(os.environ.update, environ)
+        self.addCleanup(os.environ.clear)
+        os.environ[keypool.ENV_POOL] = self.path
+        os.environ[keypool.ENV_POOL_SIZE] = '0'
+        state = keypool._pool, keypool._pool_created
+        self.addCleanup(setattr, keypool, '_pool', state[0])
+        self.addCleanup(setattr, keypool, '_pool_created', state[1])
+        keypool._pool, keypool._pool_created = None, False
+
+    def test_created_on_first_use(self):
+        reload(keypool)
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(pool_threads(), [])
+        pool = keypool.get_pool()
+        self.assertEqual(pool.path, self.path)
+        self.assertIs(keypool.get_pool(), pool)
+
+    def test_not_configured(self):
+        del os.environ[keypool.ENV_POOL]
+        self.assertIsNone(keypool.get_pool())
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_unsafe_directory(self):
+        os.mkdir(self.path, 0755)
+        os.chmod(self.path, 0755)
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            self.assertIsNone(keypool.get_pool())
+        self.assertEqual(len(caught), 1)
+
+
+class KeyPoolDirectoryTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.path = os.path.join(tmp, 'pool')
+
+    def test_creates_private_directory(self):
+        umask = os.umask(0)
+        try:
+            keypool.KeyPool(self.path)
+        finally:
+            os.umask(umask)
+        self.assertEqual(mode(self.path), 0700)
+
+    def test_private_directory(self):
+        os.mkdir(self.path, 0700)
+        keypool.KeyPool(self.path)
+        self.assertEqual(mode(self.path), 0700)
+
+    def test_accessible_directory(self):
+        for accessible in 0750, 0705, 0777:
+            os.mkdir(self.path)
+            os.chmod(self.path, accessible)
+            with self.assertRaises(ValueError):
+                keypool.KeyPool(self.path)
+            self.assertEqual(mode(self.path), accessible)
+            os.rmdir(self.path)
+
+    @unittest.skipUnless(os.getuid() == 0, 'requires root to chown')
+    def test_foreign_directory(self):
+        os.mkdir(self.path, 0700)
+        os.chown(self.path, 1, -1)
+        with self.assertRaises(ValueError):
+            keypool.KeyPool(self.path)
+
+
+class KeyPoolTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.path = os.path.join(tmp, 'pool')
+        self.ids = count()
+
+    def generate(self, key_type):
+        i = next(self.ids)
+        return 'private {}'.format(i), 'public {}'.format(i)
+
+    def pool(self, size=0):
+        return keypool.KeyPool(self.path, size, generate=self.generate)
+
+    def join(self, *pools):
+        for pool in pools:
+            for thread in pool._threads.values():
+                thread.join()
+
+    def test_put_take(self):
+        pool = self.pool()
+        pool.put(keypool.KEY_RSA, 'private', 'public')
+        self.assertIsNone(pool.take(keypool.KEY_ECDSA))
+        self.assertEqual(pool.take(keypool.KEY_RSA), ('private', 'public'))
+        self.assertIsNone(pool.take(keypool.KEY_RSA))
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_refill(self):
+        pool = self.pool(3)
+        self.assertIsNone(pool.take(keypool.KEY_RSA))
+        self.join(pool)
+        self.assertEqual(len(pool._keys(keypool.KEY_RSA)), 3)
+        self.assertEqual(pool._keys(keypool.KEY_ECDSA), [])
+
+    def test_concurrent_refills(self):
+        pools = [self.pool(3) for _ in range(4)]
+        for pool in pools:
+            pool.refill(keypool.KEY_RSA)
+        self.join(*pools)
+        keys = len(pools[0]._keys(keypool.KEY_RSA))
+        self.assertGreaterEqual(keys, 3)
+        self.assertLessEqual(keys, 3 + len(pools) - 1)
+
+    def test_concurrent_takes(self):
+        pools = [self.pool() for _ in range(4)]
+        for _ in range(50):
+            pools[0].put(keypool.KEY_RSA, *self.generate(keypool.KEY_RSA))
+        taken = []
+
+        def take(pool):
+            while True:
+                key = pool.take(keypool.KEY_RSA)
+                if key is None:
+                    return
+                taken.append(key)
+        threads = [threading.Thread(target=take, args=(pool,))
+                   for pool in pools for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(taken), 50)
+        self.assertEqual(len(set(taken)), 50)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_corrupt_keys(self):
+        pool = self.pool()
+        for i, data in enumerate(('{"private": "p', '{}', '[]')):
+            with open(os.path.join(self.path, 'rsa-{}.key'.format(i)),
+                      'w') as f:
+                f.write(data)
+        pool.put(keypool.KEY_RSA, 'private', 'public')
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter('always')
+            keys = [pool.take(keypool.KEY_RSA) for _ in range(2)]
+        self.assertEqual(keys, [('private', 'public'), None])
+        self.assertEqual(len(caught), 3)
+        self.assertEqual(os.listdir(self.path), [])
+
+    def test_new_key_falls_back(self):
+        pool = self.pool()
+        with open(os.path.join(self.path, 'ed25519-0.key'), 'w') as f:
+            f.write('corrupt')
+        state = keypool._pool, keypool._pool_created
+        self.addCleanup(setattr, keypool, '_pool', state[0])
+        self.addCleanup(setattr, keypool, '_pool_created', state[1])
+        keypool._pool, keypool._pool_created = pool, True
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            private_key, public_key = keypool.new_key(keypool.KEY_ED25519)
+        self.assertTrue(public_key.startswith('ssh-ed25519 '))
+        self.assertEqual(os.listdir(self.path), [])
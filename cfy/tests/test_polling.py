@@ -0,0 +1,67 @@
+# coding=UTF-8
+
+"""Tests for polling scheduled by the expected latency of transitions."""
+
+import unittest
+
+from cfy.polling import (LatencyModel, poll)
+
+
+class FakeClock(object):
+
+    """Clock advanced by sleeping."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class PollTest(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.model = LatencyModel()
+
+    def poll(self, done_at, timeout=100, transition='t', **kwargs):
+        return poll(lambda: self.clock.now >= done_at, timeout, transition,
+                    model=self.model, clock=self.clock,
+                    sleep=self.clock.sleep, **kwargs)
+
+    def test_backs_off(self):
+        self.assertTrue(self.poll(3, delay=0.5, backoff=2))
+        self.assertEqual(self.clock.sleeps, [0.5, 1, 2])
+        self.assertEqual(self.model.expected('t'), 3.5)
+
+    def test_maximum(self):
+        self.poll(10, delay=1, backoff=4, maximum=3)
+        self.assertEqual(self.clock.sleeps, [1, 3, 3, 3])
+
+    def test_timeout(self):
+        self.assertFalse(self.poll(10, timeout=2, delay=1, backoff=1))
+        self.assertEqual(self.clock.now, 2)
+        self.assertIsNone(self.model.expected('t'))
+
+    def test_waits_for_expected_duration(self):
+        self.model.observe('t', 10)
+        self.poll(10)
+        self.assertEqual(len(self.clock.sleeps), 2)
+        self.assertAlmostEqual(self.clock.sleeps[0], 9)
+        self.assertAlmostEqual(self.clock.sleeps[1], 1)
+
+    def test_immediate_success_not_observed(self):
+        self.assertTrue(self.poll(0))
+        self.assertEqual(self.clock.sleeps, [])
+        self.assertIsNone(self.model.expected('t'))
+
+    def test_immediate_success_keeps_expected_duration(self):
+        self.model.observe('t', 10)
+        for _ in range(5):
+            self.poll(0)
+        self.assertEqual(self.model.expected('t'), 10)
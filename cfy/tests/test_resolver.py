@@ -0,0 +1,146 @@
+# coding=UTF-8
+
+"""Tests for the cache of resolved resources."""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import warnings
+
+import cfy
+from cfy.resolver import (LRUCache, Resolver, SQLiteStore)
+from cfy.tests.base import FakeFCOTestCase
+from resttypes import (cobjects, enums)
+
+RT = enums.ResourceType
+
+
+class LRUCacheTest(unittest.TestCase):
+
+    def test_expiry(self):
+        cache = LRUCache()
+        cache.put('a', 1, 10)
+        self.assertEqual(cache.get('a', 5), (1, 10))
+        self.assertIsNone(cache.get('a', 10))
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put('a', 1, 10)
+        cache.put('b', 2, 10)
+        cache.get('a', 0)
+        cache.put('c', 3, 10)
+        self.assertIsNone(cache.get('b', 0))
+        self.assertEqual(cache.get('a', 0), (1, 10))
+        self.assertEqual(cache.get('c', 0), (3, 10))
+
+
+class SQLiteStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.path = os.path.join(tmp, 'store.db')
+
+    def test_rebuilds_type(self):
+        store = SQLiteStore(self.path)
+        image = cobjects.Image(resourceUUID='u', resourceName='Image')
+        store.put('k', image, 10)
+        found, expires = store.get('k', 5)
+        self.assertIs(type(found), cobjects.Image)
+        self.assertEqual(found.resourceName, 'Image')
+        self.assertEqual(expires, 10)
+        self.assertIsNone(store.get('k', 10))
+
+    def test_malformed_entries(self):
+        store = SQLiteStore(self.path)
+        store._execute("INSERT INTO resources VALUES ('json', 'Image', "
+                       "'{', 10)")
+        store._execute("INSERT INTO resources VALUES ('data', 'Image', "
+                       "'{\"size\": \"big\"}', 10)")
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            self.assertIsNone(store.get('json', 5))
+            self.assertIsNone(store.get('data', 5))
+        self.assertEqual(store._execute('SELECT * FROM resources'), [])
+
+    def test_recreates_older_versions(self):
+        db = sqlite3.connect(self.path)
+        with db:
+            db.execute('CREATE TABLE resources (key TEXT PRIMARY KEY, '
+                       'data TEXT NOT NULL, expires REAL NOT NULL)')
+            db.execute("INSERT INTO resources VALUES ('k', '{}', 10)")
+        db.close()
+        store = SQLiteStore(self.path)
+        self.assertIsNone(store.get('k', 5))
+        store.put('k', cobjects.Image(resourceUUID='u'), 10)
+        self.assertIs(type(store.get('k', 5)[0]), cobjects.Image)
+
+
+class ResolverTest(FakeFCOTestCase):
+
+    def setUp(self):
+        super(ResolverTest, self).setUp()
+        tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, tmp)
+        self.store = SQLiteStore(os.path.join(tmp, 'store.db'))
+        self.now = 0
+        self.resolver = self.resolver_()
+
+    def resolver_(self):
+        return Resolver(self.store, timer=lambda: self.now)
+
+    def resolve(self, resolver, res_id=None):
+        return self.requests_made(resolver.get_resource, self.api,
+                                  res_id or self.names['image'], RT.IMAGE)
+
+    def test_tiers_return_same_type(self):
+        resolved, requests = self.resolve(self.resolver)
+        self.assertEqual(requests, 1)
+        cached, requests = self.resolve(self.resolver)
+        self.assertEqual(requests, 0)
+        stored, requests = self.resolve(self.resolver_())
+        self.assertEqual(requests, 0)
+        self.assertIs(type(cached), type(resolved))
+        self.assertIs(type(stored), type(resolved))
+        self.assertEqual(stored.untype(), resolved.untype())
+
+    def test_expiry(self):
+        self.resolve(self.resolver)
+        self.now = self.resolver.ttls[RT.IMAGE]
+        _, requests = self.resolve(self.resolver)
+        self.assertEqual(requests, 1)
+
+    def test_falls_back_on_malformed_entries(self):
+        key = Resolver.key(self.api, self.names['image'], RT.IMAGE,
+                           enums.ResourceState.ACTIVE)
+        self.store._execute('INSERT INTO resources VALUES (?, ?, ?, ?)', key,
+                            'Image', '{', 10)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore')
+            image, requests = self.resolve(self.resolver)
+        self.assertEqual(image.resourceName, self.names['image'])
+        self.assertEqual(requests, 1)
+        self.assertEqual(self.resolve(self.resolver_())[1], 0)
+
+    def test_uncached_type(self):
+        server = self.fco.add('SERVER', 'Server')
+        for _ in range(2):
+            _, requests = self.requests_made(
+                self.resolver.get_resource, self.api, server['resourceUUID'],
+                RT.SERVER)
+            self.assertEqual(requests, 1)
+
+    def test_invalidated_on_missing_resource(self):
+        image = self.resolver.get_resource(self.api, self.names['image'],
+                                           RT.IMAGE)
+        key = Resolver.key(self.api, image.resourceUUID, RT.IMAGE,
+                           enums.ResourceState.ACTIVE)
+        self.resolve(self.resolver, image.resourceUUID)
+        del self.fco.resources[image.resourceUUID]
+        self.now = self.resolver.ttls[RT.IMAGE]
+        with self.assertRaises(cfy.NoResourceError):
+            self.resolve(self.resolver, image.resourceUUID)
+        self.assertIsNone(self.resolver.cache.get(key, 0))
+        self.assertIsNone(self.store.get(key, 0))
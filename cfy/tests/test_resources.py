@@ -0,0 +1,57 @@
+# coding=UTF-8
+
+"""Tests for looking up resources by name or UUID."""
+
+import cfy
+from cfy.tests.base import FakeFCOTestCase
+from resttypes import enums
+
+RT = enums.ResourceType
+
+
+class GetResourceTest(FakeFCOTestCase):
+
+    def test_by_name(self):
+        image, requests = self.requests_made(
+            cfy.get_resource, self.api, self.names['image'], RT.IMAGE)
+        self.assertEqual(image.resourceName, self.names['image'])
+        self.assertEqual(requests, 1)
+
+    def test_by_uuid(self):
+        image = self.fco.add('IMAGE', 'Image')
+        found, requests = self.requests_made(
+            cfy.get_resource, self.api, image['resourceUUID'], RT.IMAGE)
+        self.assertEqual(found.resourceUUID, image['resourceUUID'])
+        self.assertEqual(requests, 1)
+
+    def test_uuid_shaped_name(self):
+        uuid = self.fco.uuid()
+        image = self.fco.add('IMAGE', uuid)
+        found, requests = self.requests_made(
+            cfy.get_resource, self.api, uuid, RT.IMAGE)
+        self.assertEqual(found.resourceUUID, image['resourceUUID'])
+        self.assertEqual(requests, 2)
+
+    def test_uuid_takes_precedence(self):
+        image = self.fco.add('IMAGE', 'Image')
+        self.fco.add('IMAGE', image['resourceUUID'])
+        found = cfy.get_resource(self.api, image['resourceUUID'], RT.IMAGE)
+        self.assertEqual(found.resourceUUID, image['resourceUUID'])
+
+    def test_missing_name(self):
+        with self.assertRaises(cfy.NoResourceError):
+            cfy.get_resource(self.api, 'Missing', RT.IMAGE)
+        self.assertEqual(len(self.fco.requests), 1)
+
+    def test_conflicting_names(self):
+        self.fco.add('IMAGE', 'Image')
+        self.fco.add('IMAGE', 'Image')
+        with self.assertRaises(cfy.ConflictingResourceError):
+            cfy.get_resource(self.api, 'Image', RT.IMAGE)
+        self.assertEqual(len(self.fco.requests), 1)
+
+    def test_force_uuid(self):
+        with self.assertRaises(cfy.NoResourceError):
+            cfy.get_resource(self.api, self.names['image'], RT.IMAGE,
+                             force_uuid=True)
+        self.assertEqual(len(self.fco.requests), 1)
@@ -0,0 +1,102 @@
+# coding=UTF-8
+
+"""Tests for creating servers."""
+
+import threading
+
+import cfy
+from cfy.tests.base import FakeFCOTestCase
+from resttypes import enums
+
+RT = enums.ResourceType
+
+
+class CreateServersTest(FakeFCOTestCase):
+
+    def spec(self, name, **kwargs):
+        spec = {'server_po': self.names['server_type'],
+                'image': self.names['image'], 'vdc': self.names['vdc'],
+                'network': self.names['network'], 'cpu_count': 1,
+                'ram_amount': 512, 'name': name}
+        spec.update(kwargs)
+        return spec
+
+    def test_create_servers(self):
+        lock = threading.Lock()
+        resolved = []
+
+        def resolve(fco_api, res_id, res_type, *args):
+            with lock:
+                resolved.append((res_id, res_type))
+            return cfy.get_resource(fco_api, res_id, res_type, *args)
+
+        specs = [self.spec('Server {}'.format(i),
+                           keys=[self.names['manager_key']])
+                 for i in range(6)]
+        results = cfy.create_servers(self.api, specs, resolve, max_workers=3)
+
+        self.assertEqual(len(results), 6)
+        self.assertEqual(len(set(r['uuid'] for r in results)), 6)
+        self.assertEqual(len(set(r['ip'] for r in results)), 6)
+        for spec, result in zip(specs, results):
+            server = self.fco.resources[result['uuid']]
+            self.assertEqual(server['resourceName'], spec['name'])
+            self.assertEqual(server['status'], enums.ServerStatus.RUNNING)
+            self.assertEqual([n['resourceUUID'] for n in server['nics']],
+                             [result['nic']])
+            self.assertEqual(len(server['sshkeys']), 1)
+        # Shared configuration is resolved once
+        self.assertEqual(len(resolved), len(set(resolved)))
+
+    def test_failures_are_per_server(self):
+        specs = [self.spec('Server'), self.spec('Missing', image='Missing')]
+        created, missing = cfy.create_servers(self.api, specs)
+        self.assertIn('uuid', created)
+        self.assertIsInstance(missing['error'], cfy.NoResourceError)
+        self.assertEqual(
+            [r['resourceName'] for r in self.fco.resources.values()
+             if r['resourceType'] == 'SERVER'], ['Server'])
+
+
+class CreateServerKeysTest(FakeFCOTestCase):
+
+    def create_server(self, keys):
+        image = cfy.get_resource(self.api, self.names['image'], RT.IMAGE)
+        vdc = cfy.get_resource(self.api, self.names['vdc'], RT.VDC)
+        server_po = cfy.get_resource(self.api, self.names['server_type'],
+                                     RT.PRODUCTOFFER)
+        disk_po = cfy.get_resource(self.api, '20 GB Storage Disk',
+                                   RT.PRODUCTOFFER)
+        server_uuid = cfy.create_server(
+            self.api, server_po.resourceUUID, image.resourceUUID,
+            vdc.clusterUUID, vdc.resourceUUID, 1, 512, disk_po.resourceUUID,
+            keys, 'Server', disk_size=image.size)
+        return self.fco.resources[server_uuid]
+
+    def test_create_ssh_keys(self):
+        public_keys = ['ssh-rsa AAAA {}'.format(i) for i in range(4)]
+        uuids = cfy.create_ssh_keys(self.api, public_keys, 'Key',
+                                    max_workers=2)
+        self.assertEqual([self.fco.resources[uuid]['publicKey']
+                          for uuid in uuids], public_keys)
+
+    def test_key_uuids(self):
+        uuids = cfy.create_ssh_keys(self.api, ['ssh-rsa AAAA 1',
+                                               'ssh-rsa AAAA 2'])
+        server = self.create_server(uuids)
+        self.assertEqual([key['resourceUUID'] for key in server['sshkeys']],
+                         uuids)
+
+    def test_key_uuid(self):
+        uuid, = cfy.create_ssh_keys(self.api, ['ssh-rsa AAAA 1'])
+        server = self.create_server(uuid)
+        self.assertEqual([key['resourceUUID'] for key in server['sshkeys']],
+                         [uuid])
+
+    def test_keys_and_uuids(self):
+        manager_key = cfy.get_resource(self.api, self.names['manager_key'],
+                                       RT.SSHKEY)
+        uuids = cfy.create_ssh_keys(self.api, ['ssh-rsa AAAA 1'])
+        server = self.create_server([manager_key] + uuids)
+        self.assertEqual([key['resourceUUID'] for key in server['sshkeys']],
+                         [manager_key.resourceUUID] + uuids)
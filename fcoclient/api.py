@@ -5,8 +5,7 @@
 import fcoclient.clients as clients
 import fcoclient.exceptions as exceptions
 import resttypes.endpoints as endpoints
-
-import json
+from resttypes import encode_json
 
 
 class REST(object):
@@ -40,6 +39,18 @@ class REST(object):
             return self.query(endpoint, *args, **kwargs)
         return wrapper
 
+    def prepare(self, endpoint, parameters=None, data=None, **kwargs):
+        """
+        Prepare an API query to the given endpoint.
+
+        :param endpoint: name of the endpoint
+        :param parameters: parameters for the endpoint
+        :param data: data for the endpoint
+        :param kwargs: alternative method for supplying parameters or data
+        :return: prepared query
+        """
+        return PreparedQuery(self, endpoint, parameters, data, **kwargs)
+
     def query(self, endpoint, parameters=None, data=None, validate=False,
               **kwargs):
         """
@@ -52,36 +63,70 @@ class REST(object):
         :param kwargs: alternative method for supplying parameters or data
         :return: validated, data if validate true, otherwise only data
         """
-        endpoint = getattr(endpoints, endpoint)(parameters, data, **kwargs)
-        type_, url = endpoint.endpoint
-        payload = endpoint.untype()
+        return self.prepare(endpoint, parameters, data, **kwargs)(validate)
+
+
+class PreparedQuery(object):
 
-        self.logger.debug('%s', payload)
+    """API query validated and encoded once, to be performed repeatedly.
 
-        if not len(payload):
-            payload = None
+    Useful when polling, as every execution only makes the request and types
+    the response.
+    """
+
+    def __init__(self, api, endpoint, parameters=None, data=None, **kwargs):
+        """
+        Prepare an API query to the given endpoint.
+
+        :param api: FCO REST API interface
+        :param endpoint: name of the endpoint
+        :param parameters: parameters for the endpoint
+        :param data: data for the endpoint
+        :param kwargs: alternative method for supplying parameters or data
+        """
+        endpoint = endpoint[0].capitalize() + endpoint[1:]
+        self.logger = api.logger
+        self.endpoint = getattr(endpoints, endpoint)(parameters, data,
+                                                     **kwargs)
+        type_, self.url = self.endpoint.endpoint
+
+        # POST payload needs to be JSON-encoded, so skip untyping it
+        if not len(self.endpoint._data):
+            self.payload = None
+        elif type_ is endpoints.Verbs.POST:
+            self.payload = encode_json(self.endpoint)
+        else:
+            self.payload = self.endpoint.untype()
 
         self.logger.debug('REST API generated endpoint:\nTYPE: %s\nURL: %s\n'
-                          'DATA: %s', type_, url, payload)
+                          'DATA: %s', type_, self.url, self.payload)
 
         if type_ is endpoints.Verbs.PUT:
-            fn = self.client.put
+            self.fn = api.client.put
         elif type_ is endpoints.Verbs.GET:
-            fn = self.client.get
+            self.fn = api.client.get
         elif type_ is endpoints.Verbs.POST:
-            fn = self.client.post
-            # POST payload needs to be JSON-encoded
-            if payload:
-                payload = json.JSONEncoder().encode(payload)
+            self.fn = api.client.post
         elif type_ is endpoints.Verbs.DELETE:
-            fn = self.client.delete
+            self.fn = api.client.delete
         else:
             raise exceptions.NonRecoverableError('unsupported API verb')
 
-        rv = fn(url, payload)
+        self.returns = self.endpoint.RETURNS.items()[0][1]
+
+    def __call__(self, validate=False, timeout=None):
+        """
+        Perform the API query.
+
+        :param validate: validate return data?
+        :param timeout: seconds to wait for a response, including any
+            retries, raising `RequestTimeout` once exceeded (optional)
+        :return: validated, data if validate true, otherwise only data
+        """
+        rv = self.fn(self.url, self.payload, timeout=timeout)
         self.logger.debug('REST API return value: %s', rv)
 
         if validate:
-            return rv, endpoint.validate_return(rv)
+            return rv, self.endpoint.validate_return(rv)
         else:
-            return endpoint.RETURNS.items()[0][1](rv)
+            return self.returns(rv)
@@ -4,12 +4,13 @@
 
 from functools import wraps
 
-from fcoclient.exceptions import (NonRecoverableError, RecoverableError)
+from fcoclient.exceptions import (NonRecoverableError, RecoverableError,
+                                  RequestTimeout)
 
 import requests
 import json
 from requests import codes as rsc
-from time import sleep
+from time import (sleep, time)
 
 
 # REST Client default settings
@@ -17,6 +18,8 @@ REST_RETRY_COUNT = 5
 REST_RETRY_DELAY = 30
 REST_FAILURE_EXCEPTION = NonRecoverableError
 REST_INTERNAL_RETRY = True
+# Least time in seconds an attempt of a request with a timeout is given
+MIN_TIMEOUT = 0.001
 
 REST_API_VERSION = '5.0'
 REST_HEADERS = {'content-type': 'application/json'}
@@ -36,6 +39,7 @@ PROP_CLIENT_CA_CERT = 'verify_ca_cert'
 # Configurable kwargs keys for client
 KW_PAYLOAD = 'payload'
 KW_PATTERN = 'pattern'
+KW_TIMEOUT = 'timeout'
 
 
 def _rest_client_retry_and_auth(f):
@@ -52,7 +56,8 @@ def _rest_client_retry_and_auth(f):
 
         :param endpoint: URL of the endpoint
         :param data: data to include with the request
-        :param kwargs: alternative method of including data
+        :param kwargs: alternative method of including data, or the timeout
+            in seconds of the request, including any retries
         :return: content of a successful response
         """
         # TODO: remove legacy block
@@ -71,6 +76,8 @@ def _rest_client_retry_and_auth(f):
             endpoint=endpoint)
         retry_count = self.retry_count
         payload = kwargs.get(KW_PAYLOAD)
+        timeout = kwargs.get(KW_TIMEOUT)
+        deadline = None if timeout is None else time() + timeout
 
         if data:
             payload = data
@@ -82,8 +89,20 @@ def _rest_client_retry_and_auth(f):
             self.logger.debug('Client function: %s', f.__name__)
             self.logger.debug('Client URL: %s', url)
             self.logger.debug('Client data: %s', data)
-            r = f(self, url, payload, self.auth, self.headers,
-                  self.verify)
+            if deadline is not None:
+                # Each attempt only gets the time left of the whole request
+                timeout = max(deadline - time(), MIN_TIMEOUT)
+            try:
+                r = f(self, url, payload, self.auth, self.headers,
+                      self.verify, timeout)
+            except requests.Timeout as e:
+                if deadline is None:
+                    # Timed out by a default of the client function
+                    message = 'Request timed out: {}'.format(e)
+                else:
+                    message = 'Request timed out after {} seconds'.format(
+                        kwargs.get(KW_TIMEOUT))
+                raise RequestTimeout(message, self.retry_delay)
 
             self.logger.debug('Client final URL: {}'.format(r.url))
             self.logger.debug('Full content: {}'.format(r.content))
@@ -145,6 +164,13 @@ def _rest_client_retry_and_auth(f):
             if terminate:
                 self.logger.error(error)
                 raise NonRecoverableError(error)
+            elif (self.internal_retry and deadline is not None and
+                  time() + self.retry_delay >= deadline):
+                # Retrying would only time out after sleeping
+                self.logger.warn(error)
+                raise RequestTimeout('Request timed out after {} seconds: {}'
+                                     .format(kwargs.get(KW_TIMEOUT), error),
+                                     self.retry_delay)
             elif self.internal_retry:
                 self.logger.warn(error)
                 retry_count -= 1
@@ -221,28 +247,28 @@ class RESTClient(APIClient):
         self.verify = self.auth2.get(PROP_CLIENT_CA_CERT, True)
 
     @_rest_client_retry_and_auth
-    def post(self, url, data, auth, headers, verify):
+    def post(self, url, data, auth, headers, verify, timeout=None):
         """Make POST request to FCO API."""
         return requests.post(url, data, auth=auth, headers=headers,
-                             verify=verify)
+                             verify=verify, timeout=timeout)
 
     @_rest_client_retry_and_auth
-    def get(self, url, data, auth, headers, verify):
+    def get(self, url, data, auth, headers, verify, timeout=None):
         """Make GET request to FCO API."""
         return requests.get(url, params=data, auth=auth, headers=headers,
-                            verify=verify)
+                            verify=verify, timeout=timeout)
 
     @_rest_client_retry_and_auth
-    def put(self, url, data, auth, headers, verify):
+    def put(self, url, data, auth, headers, verify, timeout=None):
         """Make PUT request to FCO API."""
         return requests.put(url, data, auth=auth, headers=headers,
-                            verify=verify)
+                            verify=verify, timeout=timeout)
 
     @_rest_client_retry_and_auth
-    def delete(self, url, data, auth, headers, verify):
+    def delete(self, url, data, auth, headers, verify, timeout=None):
         """Make DELETE request to FCO API."""
         return requests.delete(url, params=data, auth=auth, headers=headers,
-                               verify=verify)
+                               verify=verify, timeout=timeout)
 
 
 # "Usable" Client Classes
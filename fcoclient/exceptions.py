@@ -31,3 +31,8 @@ class RecoverableError(Exception):
         super(Exception, self).__init__(message)
 
         self.retry_after = retry_after
+
+
+class RequestTimeout(RecoverableError):
+
+    """A request that did not complete within its timeout."""
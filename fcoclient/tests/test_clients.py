@@ -0,0 +1,108 @@
+# coding=UTF-8
+
+"""Tests for the timeouts of REST client requests."""
+
+import json
+import logging
+import threading
+import time
+import unittest
+from BaseHTTPServer import (BaseHTTPRequestHandler, HTTPServer)
+from SocketServer import ThreadingMixIn
+
+import requests
+
+from fcoclient.clients import (APITokenRESTClient,
+                               _rest_client_retry_and_auth)
+from fcoclient.exceptions import RequestTimeout
+
+
+class BusyHandler(BaseHTTPRequestHandler):
+
+    """Handler responding that the service is unavailable."""
+
+    def do_GET(self):
+        self.server.requests += 1
+        time.sleep(self.server.latency)
+        body = json.dumps({'message': 'busy'})
+        self.send_response(503)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class BusyServer(ThreadingMixIn, HTTPServer):
+
+    daemon_threads = True
+
+    def __init__(self, latency=0):
+        HTTPServer.__init__(self, ('127.0.0.1', 0), BusyHandler)
+        self.latency = latency
+        self.requests = 0
+
+    def handle_error(self, request, client_address):
+        # The client gives up on requests once they time out
+        pass
+
+
+class DefaultTimeoutClient(APITokenRESTClient):
+
+    """Client timing out GET requests by default."""
+
+    @_rest_client_retry_and_auth
+    def get(self, url, data, auth, headers, verify, timeout=None):
+        return requests.get(url, params=data, auth=auth, headers=headers,
+                            verify=verify, timeout=timeout or 0.1)
+
+
+class TimeoutTest(unittest.TestCase):
+
+    def client(self, latency=0, cls=APITokenRESTClient, **kwargs):
+        server = BusyServer(latency)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(server.server_close)
+        self.addCleanup(server.shutdown)
+        self.server = server
+        auth = {'token': 't',
+                'url': 'http://{}:{}'.format(*server.server_address)}
+        client = cls(auth, logger=logging.getLogger(__name__), **kwargs)
+        return client
+
+    def assertTimesOut(self, client, timeout, within):
+        start = time.time()
+        kwargs = {} if timeout is None else {'timeout': timeout}
+        with self.assertRaises(RequestTimeout):
+            client.get('resources/list', **kwargs)
+        self.assertLess(time.time() - start, within)
+
+    def test_no_retry_past_deadline(self):
+        client = self.client(retry_count=5, retry_delay=30)
+        self.assertTimesOut(client, 5, 1)
+        self.assertEqual(self.server.requests, 1)
+
+    def test_retries_within_deadline(self):
+        client = self.client(retry_count=100, retry_delay=0.1)
+        self.assertTimesOut(client, 0.35, 0.35)
+        self.assertGreater(self.server.requests, 1)
+        self.assertLess(self.server.requests, 5)
+
+    def test_attempts_share_deadline(self):
+        client = self.client(latency=0.3, retry_count=100, retry_delay=0.05)
+        self.assertTimesOut(client, 0.5, 0.7)
+        self.assertEqual(self.server.requests, 2)
+
+    def test_retries_without_timeout(self):
+        client = self.client(retry_count=3, retry_delay=0)
+        client.get('resources/list')
+        self.assertEqual(self.server.requests, 3)
+
+    def test_default_timeout(self):
+        client = self.client(latency=0.3, cls=DefaultTimeoutClient,
+                             retry_count=5, retry_delay=30)
+        self.assertTimesOut(client, None, 1)
+        self.assertEqual(self.server.requests, 1)
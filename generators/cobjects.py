@@ -56,9 +56,10 @@ def topological_sort(data):
     return layers, undefined, data
 
 
-def gen_single(co_name, co, out=[]):
-    """Generate single cobject definition."""
-    line(out, 'class {}(ComplexObject):', co_name)
+def gen_single(co_name, co, out=[], slots=False):
+    """Generate single cobject definition, optionally using __slots__."""
+    line(out, 'class {}({}):', co_name,
+         'SlottedComplexObject' if slots else 'ComplexObject')
     line(out)
     line(out, '    """FCO REST API {} complex object.', co_name)
     line(out)
@@ -94,12 +95,14 @@ def gen_single(co_name, co, out=[]):
     set_wrap(out, 'REQUIRED_ATTRIBS = ' + str(required), 4, 20, False)
     set_wrap(out, 'OPTIONAL_ATTRIBS = ' + str(optional), 4, 20, False)
     set_wrap(out, 'TYPES = ' + str(types), 4, 9, False)
+    if slots:
+        wrap(out, '__slots__ = ' + str(tuple(sorted(attribs))), 4, 13, False)
 
     # Final empty line
     line(out)
 
 
-def gen(enums, handler, out=[], line_wrapper=str):
+def gen(enums, handler, out=[], line_wrapper=str, slots=False):
     """Generate and write all cobject definitions."""
     layers, undefined, cyclic = topological_sort(create_relationships(enums))
 
@@ -109,13 +112,13 @@ def gen(enums, handler, out=[], line_wrapper=str):
             'desc': '',
             'attribs': {}
         }
-        gen_single(name, co, out)
+        gen_single(name, co, out, slots)
         line(out)
 
     for layer in layers:
         for name in layer:
             if name not in undefined:
-                gen_single(name, enums[name], out)
+                gen_single(name, enums[name], out, slots)
                 line(out)
 
     if cyclic:
@@ -0,0 +1,142 @@
+# coding=UTF-8
+
+"""Provides utilities to generate the schema snapshot of the REST types."""
+
+import marshal
+import os
+import sys
+from enum import Enum, EnumMeta
+from importlib import import_module
+
+import resttypes.lazy as lazy
+from resttypes.lazy import (SCHEMA_FILENAME, SCHEMA_FORMAT, build_class,
+                            decode, dependencies, source_hash)
+
+MODULES = ('resttypes.enums', 'resttypes.cobjects', 'resttypes.endpoints')
+SCALARS = (basestring, bool, int, long, float, type(None))
+
+# Class attributes derived by metaclasses or cached on first use, these are
+# recreated when the class is built rather than stored
+DERIVED = {'_template', '_types', '_validator', '_validators'}
+
+
+def encode(value):
+    """
+    Encode a value into a tagged, marshallable form.
+
+    :param value: value to encode
+    :return: tagged value, see `resttypes.lazy.decode`
+    """
+    if isinstance(value, SCALARS):
+        return 'value', value
+    elif isinstance(value, (set, frozenset)):
+        if not all(isinstance(v, SCALARS) for v in value):
+            raise TypeError('unsupported set: {}'.format(value))
+        return 'value', value
+    elif isinstance(value, type) and getattr(value, '_generated', False):
+        template = value.__base__
+        return 'factory', encode(template), [(k, encode(getattr(value, k)))
+                                             for k in template.types_keys()]
+    elif isinstance(value, type):
+        return 'ref', value.__module__, value.__name__
+    elif isinstance(value, Enum):
+        return 'ref', type(value).__module__, '{}.{}'.format(
+            type(value).__name__, value.name)
+    elif isinstance(value, tuple):
+        return 'tuple', map(encode, value)
+    elif isinstance(value, list):
+        return 'list', map(encode, value)
+    elif isinstance(value, dict):
+        return 'dict', [(encode(k), encode(v)) for k, v in value.items()]
+    raise TypeError('unsupported value: {}'.format(value))
+
+
+def attributes(cls):
+    """Class attributes needed to build the class."""
+    if isinstance(cls, EnumMeta):
+        attribs = {k: m.value for k, m in cls.__members__.items()}
+        attribs.update(__module__=cls.__module__, __doc__=cls.__doc__)
+        return attribs
+    return {k: v for k, v in vars(cls).items() if k not in DERIVED}
+
+
+def gen_single(cls):
+    """
+    Generate the snapshot entry of a single class.
+
+    :param cls: class to snapshot
+    :return: (bases, attribs) entry, or None if the class cannot be built
+        from a snapshot, e.g. as it defines methods
+    """
+    try:
+        entry = (map(encode, cls.__bases__),
+                 {k: encode(v) for k, v in attributes(cls).items()})
+    except TypeError:
+        return None
+
+    # Only keep entries building an equivalent class
+    built = build_class(cls.__name__, entry)
+    if (tuple(map(decode, entry[0])) != cls.__bases__ or
+            set(vars(built)) - DERIVED != set(vars(cls)) - DERIVED or
+            attributes(built) != attributes(cls)):
+        return None
+    return entry
+
+
+def gen_module(name):
+    """
+    Generate the snapshot of a lazily loaded module.
+
+    :param name: module name
+    :return: snapshot of the module
+    """
+    module = import_module(name)
+    module.load_all()
+    index = module._indexed()
+    classes = {}
+    needed = {}
+    for cls_name, (_, start, end) in index.items():
+        entry = gen_single(getattr(module, cls_name))
+        if entry is not None:
+            # Marshalled separately, so entries are only decoded when needed
+            classes[cls_name] = marshal.dumps(entry)
+        else:
+            # Executed from the source, once the classes it needs are loaded
+            needed[cls_name] = dependencies(module._source[start:end], index)
+    return {'hash': source_hash(module._source), 'classes': classes,
+            'dependencies': needed}
+
+
+def gen(handler=None, modules=MODULES):
+    """
+    Generate and write the schema snapshot.
+
+    :param handler: path or function to write the snapshot with, defaults to
+        the snapshot path in the resttypes package
+    :param modules: lazily loaded modules to snapshot
+    :return: snapshot
+    """
+    if any(name in sys.modules for name in modules):
+        raise RuntimeError('The schema snapshot must be generated before the '
+                           'REST types are imported')
+    lazy.use_schema = False
+
+    schema = {'format': SCHEMA_FORMAT,
+              'modules': {name: gen_module(name) for name in modules}}
+    data = marshal.dumps(schema)
+
+    if handler is None:
+        handler = os.path.join(os.path.dirname(
+            os.path.abspath(import_module('resttypes').__file__)),
+            SCHEMA_FILENAME)
+    if isinstance(handler, basestring):
+        with open(handler, 'wb') as f:
+            f.write(data)
+    else:
+        handler(data)
+
+    return schema
+
+
+if __name__ == '__main__':
+    gen()
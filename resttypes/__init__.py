@@ -3,8 +3,10 @@
 """Provides common utility functions for REST types."""
 
 from enum import Enum
-from typed import Typed
+from typed import (Typed, MetaTyped)
 from datetime import datetime, timedelta
+from threading import Lock
+from json.encoder import encode_basestring_ascii
 
 # from cloudify import ctx
 
@@ -33,8 +35,197 @@ def to_str(uni_):
     return str_
 
 
+TIMESTAMP_CACHE_SIZE = 1024
+
+# LRU cache of parsed timestamps, a dict of links in a circular doubly linked
+# list ordered by use, each link being [previous, next, timestamp, parsed]
+_timestamp_cache = {}
+_timestamp_root = []
+_timestamp_root[:] = [_timestamp_root, _timestamp_root, None, None]
+_timestamp_lock = Lock()
+
+
+def _parse_timestamp(inst):
+    """Uncached part of parse_timestamp."""
+    if (len(inst) == 24 and inst[4] == '-' and inst[7] == '-' and
+            inst[10] == 'T' and inst[13] == ':' and inst[16] == ':' and
+            inst[19] in '+-' and
+            (inst[:4] + inst[5:7] + inst[8:10] + inst[11:13] + inst[14:16] +
+             inst[17:19] + inst[20:]).isdigit()):
+        tzless = datetime(int(inst[:4]), int(inst[5:7]), int(inst[8:10]),
+                          int(inst[11:13]), int(inst[14:16]),
+                          int(inst[17:19]))
+        if inst[20:] == '0000':
+            return tzless
+    else:
+        tzless = datetime.strptime(inst[:-5], '%Y-%m-%dT%H:%M:%S')
+        if inst[-5] not in '+-' or not inst[-4:].isdigit():
+            raise ValueError('invalid UTC offset: {}'.format(inst[-5:]))
+    offset = timedelta(hours=int(inst[-4:-2]), minutes=int(inst[-2:]))
+    return tzless - offset if inst[-5] == '+' else tzless + offset
+
+
+def parse_timestamp(inst):
+    """
+    Parse an FCO timestamp in the format yyyy-MM-dd'T'HH:mm:ssZ into a UTC
+    datetime.
+
+    Timestamps in the exact format are parsed directly, anything else falls
+    back to strptime. The most recently used timestamps are kept in a small
+    LRU cache, so validating and then constructing data parses each only
+    once.
+
+    :param inst: timestamp string
+    :return: datetime
+    :raises ValueError: if inst is not a valid timestamp
+    """
+    with _timestamp_lock:
+        link = _timestamp_cache.get(inst)
+        if link is not None:
+            # Move to the most recently used end
+            previous, next_, _, parsed = link
+            previous[1] = next_
+            next_[0] = previous
+            last = _timestamp_root[0]
+            last[1] = _timestamp_root[0] = link
+            link[0] = last
+            link[1] = _timestamp_root
+            return parsed
+
+    parsed = _parse_timestamp(inst)
+    with _timestamp_lock:
+        if inst not in _timestamp_cache:
+            last = _timestamp_root[0]
+            last[1] = _timestamp_root[0] = _timestamp_cache[inst] = [
+                last, _timestamp_root, inst, parsed]
+            if len(_timestamp_cache) > TIMESTAMP_CACHE_SIZE:
+                # Evict the least recently used
+                oldest = _timestamp_root[1]
+                _timestamp_root[1] = oldest[1]
+                oldest[1][0] = _timestamp_root
+                del _timestamp_cache[oldest[2]]
+    return parsed
+
+
+def clear_timestamp_cache():
+    """Empty the cache of parsed timestamps."""
+    with _timestamp_lock:
+        _timestamp_cache.clear()
+        _timestamp_root[:] = [_timestamp_root, _timestamp_root, None, None]
+
+
+def _is_timestamp(inst):
+    """Check if inst is an FCO timestamp string."""
+    try:
+        parse_timestamp(inst)
+    except ValueError:
+        return False
+    return True
+
+
+def value_check(type_, noneable, strict=False):
+    """
+    Compile a check of a single value against type_.
+
+    The type dispatch is resolved once, so the returned function only
+    performs the checks relevant to type_.
+
+    :param type_: type to check against
+    :param noneable: can data be None
+    :param strict: check like rat_check instead of is_acceptable, i.e. only
+        accept instances of builtin types rather than convertible values
+    :return: function taking a value and returning whether it is acceptable
+    """
+    if issubclass(type_, Typed):
+        acceptable = type_.is_acceptable
+
+        def check(v):
+            return ((v is None and noneable) or isinstance(v, type_) or
+                    acceptable(v))
+    elif issubclass(type_, Enum):
+        members = getattr(type_, '_members_by_value', None)
+        if members is not None:
+            def check(v):
+                return ((v is None and noneable) or isinstance(v, type_) or
+                        v in members)
+        else:
+            def check(v):
+                return ((v is None and noneable) or isinstance(v, type_) or
+                        hasattr(type_, v))
+    elif strict:
+        def check(v):
+            return (v is None and noneable) or isinstance(v, type_)
+    elif issubclass(type_, datetime):
+        def check(v):
+            return ((v is None and noneable) or isinstance(v, type_) or
+                    _is_timestamp(v))
+    else:
+        def check(v):
+            return True
+    return check
+
+
+def compile_checks(types, noneable, strict=False):
+    """
+    Compile value checks for every entry of a types table.
+
+    :param types: mapping of names to types
+    :param noneable: can a value be None
+    :param strict: see value_check
+    :return: mapping of names to value checks
+    """
+    return {k: value_check(t, noneable, strict) for k, t in types.items()}
+
+
+def compile_validator(required, optional, types, noneable):
+    """
+    Compile the acceptability check of a Complex Object or Endpoint.
+
+    The returned function behaves like the generic is_acceptable loop of
+    Complex Objects, using precompiled per-field checks. The checks are
+    exposed as its `checks` attribute.
+
+    :param required: required names
+    :param optional: optional names
+    :param types: mapping of names to types
+    :param noneable: can a value be None
+    :return: function taking data and returning whether it is acceptable
+    """
+    checks = {k: value_check(types[k], noneable) for k in
+              (required | optional) if k in types}
+
+    def validator(inst):
+        for k, v in inst.items():
+            if k not in checks or not checks[k](v):
+                return False
+        return noneable or not (required - set(inst))
+
+    validator.checks = checks
+    return validator
+
+
+def compiled(cls, name, compile_):
+    """
+    Get a value compiled for cls, compiling and storing it on first use.
+
+    Values are looked up in the class __dict__, so subclasses never pick up
+    values compiled for their parents.
+
+    :param cls: class to store the compiled value on
+    :param name: attribute name to store the compiled value as
+    :param compile_: function returning the compiled value
+    :return: compiled value
+    """
+    try:
+        return cls.__dict__[name]
+    except KeyError:
+        value = compile_()
+        setattr(cls, name, value)
+        return value
+
+
 def rat_check(given_dict, all_, required, types, noneable,
-              fail_additional=True):
+              fail_additional=True, checks=None):
     """
     Check for required, additional and the type of given data.
 
@@ -44,6 +235,7 @@ def rat_check(given_dict, all_, required, types, noneable,
     :param types:  all the data types
     :param noneable: can a value be None
     :param fail_additional: fail the check if additional data is given
+    :param checks: value checks compiled from types with strict=True
     :return: True or False depending on whether the check passed
     """
     try:
@@ -51,21 +243,16 @@ def rat_check(given_dict, all_, required, types, noneable,
     except TypeError:
         given = set()
 
+    if checks is None:
+        checks = compile_checks(types, noneable, strict=True)
+
     missing = required - given
     additional = given - all_
     type_check = {}
 
     for k in (given & all_):
         v = given_dict[k]
-        if v is None and noneable:
-            continue
-        elif issubclass(types[k], Typed):
-            if not isinstance(v, types[k]) and not types[k].is_acceptable(v):
-                type_check[k] = (type(v).__name__, types[k].__name__)
-        elif issubclass(types[k], Enum):
-            if not isinstance(v, types[k]) and not hasattr(types[k], v):
-                type_check[k] = (type(v).__name__, types[k].__name__)
-        elif not isinstance(v, types[k]):
+        if not checks[k](v):
             type_check[k] = (type(v).__name__, types[k].__name__)
     if missing or type_check or (additional and fail_additional):
         raise TypeError('something went wrong; missing: {}, additional: {}, '
@@ -92,14 +279,12 @@ def is_acceptable(inst, type_, noneable):
         if not type_.is_acceptable(inst):
             return False
     elif issubclass(type_, Enum):
-        if not hasattr(type_, inst):
-            return False
-    elif issubclass(type_, datetime):
         try:
-            datetime.strptime(inst[:-5], '%Y-%m-%dT%H:%M:%S')
-            timedelta(hours=int(inst[-4:-2]), minutes=int(inst[-2:]))
-        except ValueError:
-            return False
+            return inst in type_._members_by_value
+        except AttributeError:
+            return hasattr(type_, inst)
+    elif issubclass(type_, datetime):
+        return _is_timestamp(inst)
     return True
 
 
@@ -115,6 +300,14 @@ def construct_data(inst, type_, noneable):
     """Construct data for a cobject of type type_."""
     if inst is None and noneable:
         return None
+    elif issubclass(type_, Enum) and hasattr(type_, '_members_by_value'):
+        if not isinstance(inst, type_):
+            try:
+                return type_._members_by_value[inst]
+            except KeyError:
+                return type_(inst)
+        else:
+            return inst
     elif issubclass(type_, (Typed, Enum)):
         if not isinstance(inst, type_):
             return type_(inst)
@@ -122,13 +315,112 @@ def construct_data(inst, type_, noneable):
             return inst
     elif issubclass(type_, datetime):
         if not isinstance(inst, type_):
-            tzless = datetime.strptime(inst[:-5], '%Y-%m-%dT%H:%M:%S')
-            gmt = tzless + timedelta(hours=int(inst[-4:-2]),
-                                     minutes=int(inst[-2:]))
-            return gmt
+            return parse_timestamp(inst)
         else:
             return inst
     elif isinstance(inst, type_):
         return inst
     else:
         return type_(inst)
+
+
+_optional_fields = {}
+
+
+def _optional(cls):
+    """Get the optional fields of a Complex Object or Endpoint class."""
+    try:
+        return _optional_fields[cls]
+    except KeyError:
+        fields = frozenset()
+        for klass in cls.__mro__:
+            attribs = vars(klass)
+            if 'OPTIONAL_ATTRIBS' in attribs:
+                fields = frozenset(attribs['OPTIONAL_ATTRIBS'])
+                break
+            if 'OPTIONAL_DATA' in attribs:
+                fields = frozenset(attribs['OPTIONAL_DATA'])
+                break
+        _optional_fields[cls] = fields
+        return fields
+
+
+def _encode_key(key):
+    """Encode a dict key the way the json module does."""
+    if isinstance(key, Enum):
+        key = key.value
+    if isinstance(key, basestring):
+        return encode_basestring_ascii(key)
+    elif key is True:
+        return '"true"'
+    elif key is False:
+        return '"false"'
+    elif key is None:
+        return '"null"'
+    elif isinstance(key, float):
+        return '"{}"'.format(repr(key))
+    elif isinstance(key, (int, long)):
+        return '"{}"'.format(key)
+    raise TypeError('key {!r} is not a string'.format(key))
+
+
+def _encode(obj, write, optional=frozenset()):
+    """Recursive part of encode_json."""
+    if obj is None:
+        write('null')
+    elif obj is True:
+        write('true')
+    elif obj is False:
+        write('false')
+    elif isinstance(obj, basestring):
+        write(encode_basestring_ascii(obj))
+    elif isinstance(obj, (int, long)):
+        write(str(obj))
+    elif isinstance(obj, float):
+        write(repr(obj))
+    elif isinstance(obj, Enum):
+        _encode(obj.value, write)
+    elif isinstance(obj, datetime):
+        write(obj.strftime('"%Y-%m-%dT%H:%M:%S+0000"'))
+    elif isinstance(type(obj), MetaTyped):
+        _encode(obj._data, write, _optional(type(obj)))
+    elif isinstance(obj, dict):
+        write('{')
+        first = True
+        for k, v in obj.items():
+            if v is None and k in optional:
+                continue
+            if not first:
+                write(',')
+            first = False
+            write(_encode_key(k))
+            write(':')
+            _encode(v, write)
+        write('}')
+    elif isinstance(obj, (list, tuple)):
+        write('[')
+        first = True
+        for v in obj:
+            if not first:
+                write(',')
+            first = False
+            _encode(v, write)
+        write(']')
+    else:
+        raise TypeError('{!r} is not JSON serializable'.format(obj))
+
+
+def encode_json(obj):
+    """
+    Encode typed data as compact JSON in a single pass.
+
+    Complex Objects, Endpoints, typed lists and dicts, enums and datetimes are
+    written directly without first creating untyped copies. Optional fields
+    of Complex Objects and Endpoints set to None are left out.
+
+    :param obj: object to encode
+    :return: JSON string
+    """
+    chunks = []
+    _encode(obj, chunks.append)
+    return ''.join(chunks)
@@ -0,0 +1,314 @@
+# coding=UTF-8
+
+"""Provides lazy loading of the generated REST type definitions."""
+
+import ast
+import marshal
+import os
+import re
+import sys
+import warnings
+import zlib
+from importlib import import_module
+from threading import RLock
+from types import ModuleType
+
+from typed import factory
+
+CLASS_PATTERN = re.compile(r'^class (\w+)\(', re.MULTILINE)
+
+SCHEMA_FILENAME = '_schema.marshal'
+SCHEMA_FORMAT = 2
+
+# Disabled when generating the snapshot, which must be built from the source
+use_schema = True
+
+# Shared by all lazy modules, as loading a class may load classes from other
+# lazy modules, e.g. endpoints require their complex objects
+_lock = RLock()
+_schemas = {}
+
+
+def index_source(source):
+    """
+    Index the top-level class definitions in source.
+
+    :param source: Python source containing only class definitions
+    :return: mapping of class names to (line number, start, end) tuples
+    """
+    matches = list(CLASS_PATTERN.finditer(source))
+    index = {}
+    for k, match in enumerate(matches):
+        start = match.start()
+        end = matches[k + 1].start() if k + 1 < len(matches) else len(source)
+        index[match.group(1)] = (source.count('\n', 0, start), start, end)
+    return index
+
+
+def dependencies(source, names):
+    """
+    Find the classes a class definition needs defined to be executed.
+
+    These are the names its bases, decorators and body load when the
+    definition is executed, so function bodies, which only run once the class
+    is used, are not searched.
+
+    :param source: source of a single top-level class definition
+    :param names: names of the classes that may be needed
+    :return: sorted list of the names needed
+    """
+    found = set()
+
+    def visit(node):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            found.add(node.id)
+        elif isinstance(node, ast.FunctionDef):
+            for child in node.decorator_list + node.args.defaults:
+                visit(child)
+            return
+        elif isinstance(node, ast.Lambda):
+            for child in node.args.defaults:
+                visit(child)
+            return
+        for child in ast.iter_child_nodes(node):
+            visit(child)
+
+    cls = ast.parse(source).body[0]
+    visit(cls)
+    found.discard(cls.name)
+    return sorted(found & set(names))
+
+
+def source_hash(source):
+    """
+    Hash generated source, identifying the schema snapshot built from it.
+
+    Only meant to catch stale snapshots, so a checksum is enough. The snapshot
+    format and the marshal version are part of the hash, so a snapshot is also
+    stale when either changes.
+
+    :param source: generated source
+    :return: hash string
+    """
+    return '{}:{}:{}:{:08x}'.format(SCHEMA_FORMAT, marshal.version,
+                                    len(source),
+                                    zlib.crc32(source) & 0xffffffff)
+
+
+def load_schema(path):
+    """
+    Load a schema snapshot, reading every file only once.
+
+    :param path: path to the snapshot
+    :return: mapping of module names to their snapshots, empty if there is no
+        usable snapshot
+    """
+    try:
+        return _schemas[path]
+    except KeyError:
+        pass
+    try:
+        with open(path, 'rb') as f:
+            schema = marshal.load(f)
+        if schema.get('format') != SCHEMA_FORMAT:
+            raise ValueError('unknown schema snapshot format')
+        schema = schema['modules']
+    except IOError:
+        schema = {}
+    except (EOFError, ValueError, TypeError, AttributeError, KeyError) as e:
+        warnings.warn('Ignoring schema snapshot {}: {}'.format(path, e),
+                      RuntimeWarning)
+        schema = {}
+    return _schemas.setdefault(path, schema)
+
+
+def resolve(module, qualname):
+    """
+    Resolve a (possibly nested) name in a module.
+
+    :param module: module name
+    :param qualname: dotted name within the module, e.g. `Verbs.GET`
+    :return: object
+    """
+    obj = import_module(module)
+    for name in qualname.split('.'):
+        obj = getattr(obj, name)
+    return obj
+
+
+def decode(value):
+    """
+    Decode a value from a schema snapshot.
+
+    :param value: tagged value, see `generators.snapshot.encode`
+    :return: decoded value
+    """
+    tag = value[0]
+    if tag == 'value':
+        return value[1]
+    elif tag == 'ref':
+        return resolve(value[1], value[2])
+    elif tag == 'factory':
+        return factory(decode(value[1]),
+                       {k: decode(v) for k, v in value[2]})
+    elif tag == 'tuple':
+        return tuple(map(decode, value[1]))
+    elif tag == 'list':
+        return map(decode, value[1])
+    elif tag == 'dict':
+        return {decode(k): decode(v) for k, v in value[1]}
+    raise ValueError('unknown schema snapshot tag: {}'.format(tag))
+
+
+def build_class(name, entry):
+    """
+    Build a class from its schema snapshot entry.
+
+    :param name: class name
+    :param entry: (bases, attribs) tuple of encoded bases and class attributes,
+        or the same marshalled
+    :return: class
+    """
+    if isinstance(entry, str):
+        entry = marshal.loads(entry)
+    bases, attribs = entry
+    bases = tuple(map(decode, bases))
+    metaclass = type(bases[0])
+    for base in bases[1:]:
+        if issubclass(type(base), metaclass):
+            metaclass = type(base)
+    return metaclass(name, bases, {k: decode(v) for k, v in attribs.items()})
+
+
+class LazyModule(ModuleType):
+
+    """Module loading its generated classes on first access.
+
+    The wrapped module provides everything the generated classes need and
+    remains their global namespace; each class is only built when first
+    requested, from the schema snapshot if it describes the class and is up to
+    date, otherwise by compiling and executing its definition from the
+    generated source.
+    """
+
+    def __init__(self, module, filename, schema=None):
+        """
+        Initialise lazy module.
+
+        :param module: module to wrap, providing the generated classes' globals
+        :param filename: path to the generated source
+        :param schema: schema snapshot of the module, if any
+        """
+        super(LazyModule, self).__init__(module.__name__, module.__doc__)
+        self.__dict__.update(module.__dict__)
+        # Keep the module alive, Python 2 clears the globals of dead modules
+        self._module = module
+        self._filename = filename
+        with open(filename) as f:
+            self._source = f.read()
+        self._index = None
+        self._loading = set()
+        self._schema = {}
+        self._dependencies = {}
+        if schema:
+            if schema['hash'] == source_hash(self._source):
+                self._schema = schema['classes']
+                self._dependencies = schema['dependencies']
+            else:
+                warnings.warn('Stale schema snapshot for {}, loading classes '
+                              'from {}'.format(self.__name__, filename),
+                              RuntimeWarning)
+
+    def __getattr__(self, name):
+        """
+        Get a generated class, loading it if necessary.
+
+        :param name: class name
+        :return: class
+        """
+        with _lock:
+            return self._load(name)
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self._schema) |
+                      set(self._indexed()))
+
+    def _indexed(self):
+        """Index the generated source on first use."""
+        if self._index is None:
+            self._index = index_source(self._source)
+        return self._index
+
+    def _load(self, name):
+        """Load a generated class and the classes it depends on."""
+        namespace = self._module.__dict__
+        if name in namespace:
+            setattr(self, name, namespace[name])
+            return namespace[name]
+        if name not in self._schema and name not in self._indexed():
+            raise AttributeError('\'module\' object has no attribute \'{}\''
+                                 .format(name))
+        if name in self._loading:
+            raise ImportError('Circular class definition: {}'.format(name))
+        if name in self._schema:
+            self._loading.add(name)
+            try:
+                namespace[name] = build_class(name, self._schema[name])
+            finally:
+                self._loading.discard(name)
+        else:
+            self._exec(name)
+        setattr(self, name, namespace[name])
+        return namespace[name]
+
+    def _exec(self, name):
+        """
+        Execute a generated class definition from the generated source, once
+        the classes it depends on are loaded.
+        """
+        namespace = self._module.__dict__
+        line, start, end = self._indexed()[name]
+        source = self._source[start:end]
+        self._loading.add(name)
+        try:
+            # Recorded by the schema snapshot, if up to date
+            needed = self._dependencies.get(name)
+            if needed is None:
+                needed = dependencies(source, self._indexed())
+            for dependency in needed:
+                self._load(dependency)
+            exec compile('\n' * line + source, self._filename,
+                         'exec') in namespace
+        finally:
+            self._loading.discard(name)
+
+    def load_all(self):
+        """Load every generated class."""
+        with _lock:
+            for name in self._indexed():
+                self._load(name)
+
+
+def lazy_module(name, filename, eager=()):
+    """
+    Replace a module with a lazily loading version of itself.
+
+    Should be called at the end of the module being replaced.
+
+    :param name: name of the module to replace
+    :param filename: name of the generated source, relative to the module
+    :param eager: classes to load immediately, e.g. ones referenced from the
+        module's own functions by their global name
+    :return: the lazy module
+    """
+    module = sys.modules[name]
+    directory = os.path.dirname(os.path.abspath(module.__file__))
+    schema = None
+    if use_schema:
+        schema = load_schema(os.path.join(directory, SCHEMA_FILENAME))
+        schema = schema.get(name)
+    lazy = sys.modules[name] = LazyModule(
+        module, os.path.join(directory, filename), schema)
+    for cls in eager:
+        getattr(lazy, cls)
+    return lazy
@@ -0,0 +1,81 @@
+# coding=UTF-8
+
+"""Tests for Complex Objects."""
+
+import unittest
+
+from generators.cobjects import gen_single
+from resttypes import cobjects
+
+
+class ComplexObjectTest(unittest.TestCase):
+
+    def test_fields(self):
+        server = cobjects.Server(resourceName='x', cpu=2)
+        self.assertEqual(server.cpu, 2)
+        self.assertEqual(sorted(server.keys()), ['cpu', 'resourceName'])
+        self.assertEqual(server.untype(), {'resourceName': 'x', 'cpu': 2})
+        self.assertRaises(AttributeError, getattr, server, 'ram')
+        self.assertRaises(AttributeError, getattr, server, 'nope')
+
+    def test_invalid_data(self):
+        self.assertRaises(Exception, cobjects.Server, cpu='two')
+
+    def test_nested_skeletons(self):
+        server = cobjects.Server(sshkeys=[cobjects.SSHKey(resourceUUID='a')])
+        self.assertEqual(server.untype(),
+                         {'sshkeys': [{'resourceUUID': 'a'}]})
+
+
+def slotted_thing():
+    """Generate a slotted Complex Object class."""
+    co = {'docstring': 'A thing', 'attribs': {
+        'name': {'type': str, 'required': True, 'desc': 'Name'},
+        'values': {'type': int, 'required': False, 'desc': 'Values'},
+        'sshkeys': {'type': (list, ('co', 'SSHKey')), 'required': False,
+                    'desc': 'Keys'}}}
+    out = []
+    gen_single('Thing', co, out, slots=True)
+    namespace = dict(vars(cobjects))
+    exec ''.join(out) in namespace
+    return namespace['Thing']
+
+
+class SlottedComplexObjectTest(unittest.TestCase):
+
+    def setUp(self):
+        self.cls = slotted_thing()
+
+    def test_no_dict(self):
+        thing = self.cls(name='a')
+        self.assertFalse(hasattr(thing, '__dict__'))
+        self.assertRaises(AttributeError, setattr, thing, 'other', 1)
+
+    def test_fields(self):
+        thing = self.cls(name='a', values=1)
+        self.assertEqual(thing.name, 'a')
+        self.assertEqual(thing['values'], 1)
+        self.assertEqual(sorted(thing.keys()), ['name', 'values'])
+        self.assertEqual(sorted(thing.items()), [('name', 'a'),
+                                                 ('values', 1)])
+        self.assertEqual(thing.untype(), {'name': 'a', 'values': 1})
+        self.assertRaises(AttributeError, getattr, thing, 'nope')
+
+    def test_invalid_data(self):
+        self.assertRaises(Exception, self.cls, name='a', values='one')
+
+    def test_filter_fields(self):
+        self.assertIs(self.cls.name, self.cls.name)
+        self.assertEqual(list((self.cls.name == 'a').value), ['a'])
+
+    def test_nested(self):
+        thing = self.cls(name='a', values=1,
+                         sshkeys=[cobjects.SSHKey(resourceUUID='k')])
+        self.assertEqual(thing.sshkeys[0].resourceUUID, 'k')
+        self.assertEqual(thing.untype(), {'name': 'a', 'values': 1,
+                                          'sshkeys': [{'resourceUUID': 'k'}]})
+
+    def test_shadowing_field(self):
+        # `values` shadows the dict-style method, as with ComplexObject
+        thing = self.cls(name='a', values=1)
+        self.assertEqual(sorted(thing.values()), [1, 'a'])
@@ -0,0 +1,29 @@
+# coding=UTF-8
+
+"""Tests for building filters from Complex Object fields."""
+
+import unittest
+
+from resttypes import cobjects, enums
+
+
+R = cobjects.Resource
+
+
+class FilterTest(unittest.TestCase):
+
+    def test_fields_cached(self):
+        self.assertIs(R.resourceUUID, R.resourceUUID)
+        self.assertRaises(AttributeError, getattr, R, 'nope')
+
+    def test_filter(self):
+        conditions = ((R.resourceUUID == 'a') &
+                      (R.resourceState == enums.ResourceState.ACTIVE))
+        self.assertEqual(
+            [(c.field, c.condition, list(c.value)) for c in conditions],
+            [('resourceUUID', enums.Condition.IS_EQUAL_TO, ['a']),
+             ('resourceState', enums.Condition.IS_EQUAL_TO, ['ACTIVE'])])
+
+    def test_filter_many_values(self):
+        condition = R.resourceUUID == ['a', 'b']
+        self.assertEqual(list(condition.value), ['a', 'b'])
@@ -0,0 +1,76 @@
+# coding=UTF-8
+
+"""Tests for lazy loading of generated classes."""
+
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from types import ModuleType
+
+from resttypes.lazy import (LazyModule, dependencies, index_source,
+                            source_hash)
+
+SOURCE = '''class A(object):
+    executed.append('A')
+
+
+class B(A):
+    executed.append('B')
+    other = C
+
+    def method(self, default=A):
+        return Unloaded
+
+
+class C(object):
+    executed.append('C')
+    values = [A for _ in range(1)]
+'''
+
+
+class DependenciesTest(unittest.TestCase):
+
+    def test_dependencies(self):
+        index = index_source(SOURCE)
+        deps = {name: dependencies(SOURCE[start:end], index.keys() +
+                                   ['Unloaded'])
+                for name, (_, start, end) in index.items()}
+        self.assertEqual(deps, {'A': [], 'B': ['A', 'C'], 'C': ['A']})
+
+
+class LazyModuleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.filename = os.path.join(self.directory, '_generated.py')
+        with open(self.filename, 'w') as f:
+            f.write(SOURCE)
+        self.module = ModuleType('lazy_test_module')
+        self.module.executed = []
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        sys.modules.pop('lazy_test_module', None)
+
+    def test_loads_dependencies_first(self):
+        lazy = LazyModule(self.module, self.filename)
+        self.assertIs(lazy.B.other, lazy.C)
+        self.assertTrue(issubclass(lazy.B, lazy.A))
+        self.assertEqual(self.module.executed, ['A', 'C', 'B'])
+
+    def test_executes_each_class_once(self):
+        lazy = LazyModule(self.module, self.filename)
+        lazy.load_all()
+        lazy.load_all()
+        self.assertEqual(sorted(self.module.executed), ['A', 'B', 'C'])
+
+    def test_dependencies_from_schema(self):
+        schema = {'hash': source_hash(SOURCE), 'classes': {},
+                  'dependencies': {'A': [], 'B': ['C'], 'C': []}}
+        lazy = LazyModule(self.module, self.filename, schema)
+        # Only the recorded dependencies are loaded, a missing one is not
+        # recovered from by retrying
+        self.assertRaises(NameError, getattr, lazy, 'B')
+        self.assertEqual(self.module.executed, ['C'])
@@ -0,0 +1,50 @@
+# coding=UTF-8
+
+"""Tests for FCO timestamp parsing."""
+
+import unittest
+from datetime import datetime
+
+import resttypes
+from resttypes import (parse_timestamp, clear_timestamp_cache)
+
+
+class ParseTimestampTest(unittest.TestCase):
+
+    def setUp(self):
+        clear_timestamp_cache()
+
+    def test_utc(self):
+        self.assertEqual(parse_timestamp('2015-10-11T11:09:08+0000'),
+                         datetime(2015, 10, 11, 11, 9, 8))
+
+    def test_offsets(self):
+        self.assertEqual(parse_timestamp('2015-10-11T11:09:08+0130'),
+                         datetime(2015, 10, 11, 9, 39, 8))
+        self.assertEqual(parse_timestamp('2015-10-11T11:09:08-0130'),
+                         datetime(2015, 10, 11, 12, 39, 8))
+
+    def test_fallback(self):
+        self.assertEqual(parse_timestamp('2015-10-11T1:09:08-0100'),
+                         datetime(2015, 10, 11, 2, 9, 8))
+
+    def test_invalid(self):
+        for inst in ('2015-10-11T11:09:08 0000', '2015-10-11T11:09:08x0000',
+                     '2015-10-11 11:09:08+0000', '2015-10-11T11:09:08+00a0',
+                     'not a timestamp', ''):
+            self.assertRaises(ValueError, parse_timestamp, inst)
+
+    def test_cache_is_lru(self):
+        size = resttypes.TIMESTAMP_CACHE_SIZE
+        first = '2015-01-01T00:00:00+0000'
+        parse_timestamp(first)
+        for i in range(size - 1):
+            parse_timestamp('2015-01-02T00:00:{:02d}+{:04d}'.format(
+                i % 60, i))
+            # Keep the first timestamp the most recently used
+            parse_timestamp(first)
+        parse_timestamp('2015-01-03T00:00:00+0000')
+        self.assertIn(first, resttypes._timestamp_cache)
+        self.assertNotIn('2015-01-02T00:00:00+0000',
+                         resttypes._timestamp_cache)
+        self.assertEqual(len(resttypes._timestamp_cache), size)
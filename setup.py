@@ -30,6 +30,7 @@ setup(
 
     # This must correspond to the actual packages in the plugin.
     packages=['fcoclient', 'resttypes', 'typed', 'cfy'],
+    package_data={'resttypes': ['_schema.marshal']},
 
     license='LICENSE',
     zip_safe=False,
@@ -37,11 +38,10 @@ setup(
         # 'cloudify-plugins-common>=3.3a5',
         'cloudify-plugins-common>=3.3a4',
         'enum34',
+        'futures',
         'requests',
         'pycrypto',
         'paramiko',
-        'spur',
-        'fabric',
         'scp'
     ],
     test_requires=[
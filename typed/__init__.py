@@ -57,6 +57,8 @@ class _NoneType(object):
 
 _None = _NoneType()
 
+_instancecheck_cache = {}
+
 
 class MetaTyped(type):
 
@@ -79,27 +81,49 @@ class MetaTyped(type):
         """
         types = [a for a, p in attribs.items() if
                  isinstance(p, ImmutableType)]
+        for a in types:
+            attribs[a].name = a
         attribs['_types'] = types
-        return type.__new__(mcs, name, bases, attribs)
+        cls = type.__new__(mcs, name, bases, attribs)
+        # Nearest non-generated ancestor, used for instance checks
+        if getattr(cls, '_generated', False):
+            cls._template = cls.__base__._template
+        else:
+            cls._template = cls
+        return cls
 
     def __instancecheck__(self, other):
         """
         Check if other "isinstance" of the given Typed class.
 
+        Results are cached per pair of classes, unless they could depend on
+        the types set on the other instance itself.
+
         :param other: object to check
         :return: True if is instance, False otherwise
         """
-        self_template = self
-        while self_template._generated:
-            self_template = self_template.__base__
-
-        other_template = type(other)
+        other_type = type(other)
         try:
-            while other_template._generated:
-                other_template = other_template.__base__
-        except AttributeError:
+            return _instancecheck_cache[self, other_type]
+        except KeyError:
             pass
 
+        result = self._instancecheck(other)
+        if (not isinstance(other_type, MetaTyped) or other_type._generated or
+                not other_type._types):
+            _instancecheck_cache[self, other_type] = result
+        return result
+
+    def _instancecheck(self, other):
+        """
+        Uncached part of __instancecheck__.
+
+        :param other: object to check
+        :return: True if is instance, False otherwise
+        """
+        self_template = self._template
+        other_template = getattr(type(other), '_template', type(other))
+
         try:
             while self_template != other_template:
                 other_template = other_template.__base__
@@ -123,7 +147,12 @@ class MetaTyped(type):
 
 class ImmutableType(object):
 
-    """Immutable "type" that "cannot" be changed once set."""
+    """Immutable "type" that "cannot" be changed once set.
+
+    Per-instance values are kept in the instance's own ``__dict__`` under a
+    private key derived from the attribute name, which MetaTyped assigns when
+    the owning class is created.
+    """
 
     def __init__(self, value=_None):
         if value is not _None:
@@ -131,27 +160,31 @@ class ImmutableType(object):
                 raise TypeError('constructing error, type must be a type, got '
                                 '{}'.format(value.__name__))
         self.value = value
-        self.types = {}
+        self.name = None
+
+    @property
+    def key(self):
+        return '_immutable_{}'.format(self.name)
 
     def __get__(self, instance, type=None):
         if self.value:
             return self.value
         try:
-            return self.types[id(instance)]
-        except KeyError:
+            return instance.__dict__[self.key]
+        except (AttributeError, KeyError):
             raise AttributeError('property not defined yet')
 
     def __set__(self, instance, value):
-        if id(instance) in self.types or self.value:
+        if self.key in instance.__dict__ or self.value:
             raise AttributeError('property already defined')
         else:
             if not isinstance(value, type):
                 raise TypeError('value must be a type, got object of type {}'
                                 .format(type(value).__name__))
-            self.types[id(instance)] = value
+            instance.__dict__[self.key] = value
 
     def __delete__(self, instance):
-        if id(instance) not in self.types or self.value:
+        if self.key not in instance.__dict__ or self.value:
             raise AttributeError('property not defined yet')
         else:
             raise AttributeError('property cannot be removed')
@@ -159,9 +192,14 @@ class ImmutableType(object):
 
 class Typed(object):
 
-    """A common ancestor to all typed objects."""
+    """A common ancestor to all typed objects.
+
+    Declares no instance attributes of its own, so subclasses can declare
+    `__slots__` to do without a per-instance `__dict__`.
+    """
 
     __metaclass__ = MetaTyped
+    __slots__ = ()
     _generated = False
     _data = None
     _type_dict = None
@@ -308,10 +346,17 @@ class Typed(object):
         return data
 
 
+_factory_cache = {}
+
+
 def factory(cls, mapping=None, name=None, **kwargs):
     """
     Factory to create a class with fixed types from a class with generic types.
 
+    Generated classes are memoised on the base class, the type mapping and the
+    name, so every type combination is only ever created once and can be
+    compared by identity.
+
     :param cls: generic base class to assign fixed types to
     :param mapping: mapping of type keys to specific types
     :param name: name of the new class
@@ -329,6 +374,14 @@ def factory(cls, mapping=None, name=None, **kwargs):
     if any([not isinstance(v, type) for _, v in mapping.items()]):
         raise TypeError('mapped types must be of type type')
 
+    key = (cls, frozenset(mapping.items()), name)
+    try:
+        return _factory_cache[key]
+    except KeyError:
+        pass
+
+    mapping = dict(mapping)
+
     if not name:
         name = '{}{}'.format(cls.__name__, ''.join([v.__name__.capitalize()
                              for _, v in mapping.items()]))
@@ -354,7 +407,7 @@ def factory(cls, mapping=None, name=None, **kwargs):
     if len(mapping):
         raise TypeError('type mapping too big: {}'.format(mapping))
 
-    return type(name, (cls,), attribs)
+    return _factory_cache.setdefault(key, type(name, (cls,), attribs))
 
 
 class TypedDict(Typed):  # TODO: setdefault, cmp/lt/gt/etc.
@@ -528,28 +581,46 @@ class TypedList(Typed):  # TODO: mul, add
         self.__class__ = factory(TypedList, {'item_type': self.item_type})
 
     def extend(self, other):
-        if hasattr(other, '__iter__'):
-            other = list(other)
-            error = TypeError('Expected all of type {}, got types {}',
-                              format(set([type(item) for item in other])))
+        """
+        Validate all items once and extend the underlying list in bulk.
 
-            for k, v in enumerate(other):
-                if v is None and self.item_type._noneable:
-                    continue
-                elif issubclass(self.item_type, (Typed, Enum)):
-                    if not isinstance(v, self.item_type):
-                        if self.item_type.is_acceptable(v):
-                            other[k] = self.item_type(v)
-                        else:
-                            raise error
-                elif not isinstance(v, self.item_type):
-                    raise error
-        else:
+        Items of Typed and Enum item types are converted where acceptable.
+        Lists made up entirely of exact instances of the item type are
+        accepted without checking items one by one.
+
+        :param other: iterable of items
+        """
+        if not hasattr(other, '__iter__'):
             raise TypeError('type {} is not iterable'.format(
                 type(other).__name__))
 
-        for i in other:
-            self.append(i)
+        item_type = self.item_type
+        other = list(other)
+
+        if issubclass(item_type, Typed):
+            acceptable = item_type.is_acceptable
+        elif issubclass(item_type, Enum):
+            def acceptable(v):
+                return hasattr(item_type, v)
+        elif all(type(v) is item_type for v in other):
+            acceptable = None
+        else:
+            def acceptable(v):
+                return False
+
+        if acceptable is not None:
+            for k, v in enumerate(other):
+                if v is None and self._noneable:
+                    continue
+                elif not isinstance(v, item_type):
+                    if not acceptable(v):
+                        raise TypeError('Expected all of type {}, got types '
+                                        '{}'.format(item_type.__name__,
+                                                    set(type(i).__name__
+                                                        for i in other)))
+                    other[k] = item_type(v)
+
+        self._data.extend(other)
 
     @TypeCheck((2, 'item_type'))
     def __setitem__(self, key, item):
@@ -0,0 +1,28 @@
+# coding=UTF-8
+
+"""Tests for typed.factory."""
+
+import unittest
+
+from typed import (factory, TypedList)
+from typed.factories import (List, Dict)
+
+
+class FactoryTest(unittest.TestCase):
+
+    def test_same_mapping_same_class(self):
+        self.assertIs(List(str), List(str))
+        self.assertIs(Dict(str, int), Dict(str, int))
+
+    def test_different_mapping_different_class(self):
+        self.assertIsNot(List(str), List(int))
+        self.assertIsNot(factory(TypedList, str),
+                         factory(TypedList, str, name='Named'))
+
+    def test_instances_of_generated_class(self):
+        self.assertIsInstance(List(str)(['a']), List(str))
+        self.assertEqual(List(str)(['a']), List(str)(['a']))
+
+    def test_invalid_mapping(self):
+        self.assertRaises(TypeError, factory, TypedList, {'item_type': 1})
+        self.assertRaises(TypeError, factory, TypedList, {})
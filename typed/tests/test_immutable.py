@@ -0,0 +1,28 @@
+# coding=UTF-8
+
+"""Tests for typed.ImmutableType."""
+
+import unittest
+
+from typed import (TypedList, TypedDict)
+
+
+class ImmutableTypeTest(unittest.TestCase):
+
+    def test_types_per_instance(self):
+        ints = TypedList([1], item_type=int)
+        strs = TypedList(['a'], item_type=str)
+        self.assertIs(ints.item_type, int)
+        self.assertIs(strs.item_type, str)
+
+    def test_type_cannot_change(self):
+        d = TypedDict({'k': 1}, key_type=str, item_type=int)
+        self.assertRaises(AttributeError, setattr, d, 'item_type', str)
+        self.assertRaises(AttributeError, delattr, d, 'item_type')
+
+    def test_recycled_instance_ids(self):
+        # Instances freed immediately are likely to reuse the same id
+        for i in range(100):
+            item_type = (int, str)[i % 2]
+            self.assertIs(TypedList([], item_type=item_type).item_type,
+                          item_type)